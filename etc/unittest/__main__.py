@@ -15,5 +15,7 @@ from .retry_provider import *
 from .thinking import *
 from .web_search import *
 from .models import *
+from .completions import *
+from .blacklist import *
 
 unittest.main()
\ No newline at end of file
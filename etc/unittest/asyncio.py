@@ -5,16 +5,32 @@ try:
 except:
     has_nest_asyncio = False 
 import unittest
+import threading
+from unittest.mock import patch
 
 import g4f
 from g4f import ChatCompletion
 from g4f.client import Client
-from .mocks import ProviderMock, AsyncProviderMock, AsyncGeneratorProviderMock
+from g4f.providers.asyncio import run_until_complete
+from g4f.completions import auto_continue
+from .mocks import ProviderMock, AsyncProviderMock, AsyncGeneratorProviderMock, YieldProviderMock
 
 DEFAULT_MESSAGES = [{'role': 'user', 'content': 'Hello'}]
 
+async def is_complete(text: str, model: str) -> bool:
+    return True
+
+def patch_completion_check(test: unittest.TestCase) -> None:
+    # The mocks answer "Mock", which the heuristics read as cut off
+    patcher = patch.object(auto_continue, "get_completion_check", is_complete)
+    patcher.start()
+    test.addCleanup(patcher.stop)
+
 class TestChatCompletion(unittest.TestCase):
 
+    def setUp(self) -> None:
+        patch_completion_check(self)
+
     async def run_exception(self):
         return ChatCompletion.create(g4f.models.default, DEFAULT_MESSAGES, AsyncProviderMock)
 
@@ -31,6 +47,16 @@ class TestChatCompletion(unittest.TestCase):
         result = ChatCompletion.create(g4f.models.default, DEFAULT_MESSAGES, AsyncGeneratorProviderMock)
         self.assertEqual("Mock", result)
         
+    def test_normalize_messages(self):
+        messages = [
+            {'role': 'system', 'content': 'A'},
+            {'role': 'system', 'content': 'B'},
+            {'role': 'user', 'content': 'Hello'},
+            {'role': 'user', 'content': 'Hello'},
+        ]
+        result = ChatCompletion.create(g4f.models.default, messages, YieldProviderMock, auto_continue=False)
+        self.assertEqual("A\n\nBHello", result)
+
     def test_await_callback(self):
         client = Client(provider=AsyncGeneratorProviderMock)
         response = client.chat.completions.create(DEFAULT_MESSAGES, "", max_tokens=0)
@@ -38,6 +64,9 @@ class TestChatCompletion(unittest.TestCase):
 
 class TestChatCompletionAsync(unittest.IsolatedAsyncioTestCase):
 
+    def setUp(self) -> None:
+        patch_completion_check(self)
+
     async def test_base(self):
         result = await ChatCompletion.create_async(g4f.models.default, DEFAULT_MESSAGES, ProviderMock)
         self.assertEqual("Mock",result)
@@ -50,12 +79,25 @@ class TestChatCompletionAsync(unittest.IsolatedAsyncioTestCase):
         result = await ChatCompletion.create_async(g4f.models.default, DEFAULT_MESSAGES, AsyncGeneratorProviderMock)
         self.assertEqual("Mock",result)
 
+    async def test_return_async_iter(self):
+        result = ChatCompletion.create_async(g4f.models.default, DEFAULT_MESSAGES, AsyncGeneratorProviderMock, return_async_iter=True)
+        self.assertEqual(["Mock"], [chunk async for chunk in result])
+
+    async def test_return_async_iter_continued(self):
+        checks = iter([False, True])
+        async def check(text: str, model: str) -> bool:
+            return next(checks)
+        with patch.object(auto_continue, "get_completion_check", check):
+            result = ChatCompletion.create_async(g4f.models.default, DEFAULT_MESSAGES, AsyncGeneratorProviderMock, return_async_iter=True)
+            self.assertEqual(["Mock", "\nMock"], [chunk async for chunk in result])
+
 class TestChatCompletionNestAsync(unittest.IsolatedAsyncioTestCase):
 
     def setUp(self) -> None:
         if not has_nest_asyncio:
             self.skipTest('"nest_asyncio" not installed')
         nest_asyncio.apply()
+        patch_completion_check(self)
 
     async def test_create(self):
         result = await ChatCompletion.create_async(g4f.models.default, DEFAULT_MESSAGES, ProviderMock)
@@ -69,5 +111,21 @@ class TestChatCompletionNestAsync(unittest.IsolatedAsyncioTestCase):
         result = ChatCompletion.create(g4f.models.default, DEFAULT_MESSAGES, AsyncGeneratorProviderMock)
         self.assertEqual("Mock",result)
 
+class TestRunUntilComplete(unittest.TestCase):
+
+    def test_loop_reused_and_closed_with_thread(self):
+        loops = []
+        def run():
+            for _ in range(2):
+                loops.append(run_until_complete(get_loop()))
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join()
+        self.assertIs(loops[0], loops[1])
+        self.assertTrue(loops[0].is_closed())
+
+async def get_loop():
+    return asyncio.get_running_loop()
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import os
+import json
+import concurrent.futures
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from g4f.config import blacklist
+
+class TestBlacklist(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "provider_blacklist.json")
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+        blacklist.load_blacklist()
+
+    def test_save_and_load(self):
+        blacklist.save_blacklist(["Provider1", "Provider2"], self.path)
+        self.assertEqual(blacklist.load_blacklist(self.path), ["Provider1", "Provider2"])
+        self.assertTrue(blacklist.is_blacklisted("Provider1"))
+        self.assertFalse(blacklist.is_blacklisted("Provider3"))
+        self.assertEqual(blacklist.get_blacklist_set(), frozenset(["Provider1", "Provider2"]))
+        self.assertEqual(sorted(os.listdir(self.tmpdir.name)), ["provider_blacklist.json", "provider_blacklist.json.lock"])
+
+    def test_empty_blacklist_not_reloaded(self):
+        blacklist.save_blacklist([], self.path)
+        with patch.object(blacklist, "load_blacklist") as load_blacklist:
+            self.assertFalse(blacklist.is_blacklisted("Provider1"))
+            self.assertEqual(blacklist.get_blacklist(), [])
+        load_blacklist.assert_not_called()
+
+    def test_load_missing_file(self):
+        self.assertEqual(blacklist.load_blacklist(self.path), [])
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_load_unchanged_file(self):
+        blacklist.save_blacklist(["Provider1"], self.path)
+        with patch.object(blacklist, "_loads", wraps=blacklist._loads) as loads:
+            blacklist.load_blacklist(self.path)
+            blacklist.load_blacklist(self.path)
+        self.assertEqual(loads.call_count, 0)
+
+    def test_load_changed_file(self):
+        blacklist.save_blacklist(["Provider1"], self.path)
+        with open(self.path, "w") as f:
+            json.dump(["Provider1", "Provider2"], f)
+        with patch.object(blacklist, "_loads", wraps=blacklist._loads) as loads:
+            self.assertEqual(blacklist.load_blacklist(self.path), ["Provider1", "Provider2"])
+        self.assertEqual(loads.call_count, 1)
+
+    def test_add_and_remove(self):
+        blacklist.save_blacklist([], self.path)
+        self.assertEqual(blacklist.add_to_blacklist("Provider1", self.path), ["Provider1"])
+        self.assertEqual(blacklist.add_to_blacklist("Provider1", self.path), ["Provider1"])
+        self.assertEqual(blacklist.remove_from_blacklist("Provider1", self.path), [])
+        with open(self.path) as f:
+            self.assertEqual(json.load(f), [])
+
+    def test_unchanged_not_saved(self):
+        blacklist.save_blacklist(["Provider1"], self.path)
+        with patch.object(blacklist, "_write_blacklist") as write_blacklist:
+            blacklist.add_to_blacklist("Provider1", self.path)
+            blacklist.remove_from_blacklist("Provider2", self.path)
+            blacklist.remove_many_from_blacklist(["Provider2", "Provider3"], self.path)
+        write_blacklist.assert_not_called()
+
+    def test_concurrent_add(self):
+        blacklist.save_blacklist([], self.path)
+        with concurrent.futures.ThreadPoolExecutor(8) as executor:
+            list(executor.map(lambda i: blacklist.add_to_blacklist(f"Provider{i}", self.path), range(16)))
+        with open(self.path) as f:
+            self.assertEqual(sorted(json.load(f)), sorted(f"Provider{i}" for i in range(16)))
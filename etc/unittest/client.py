@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import unittest
+from unittest.mock import patch
 
-from g4f.errors import ModelNotFoundError
+from g4f.errors import ModelNotFoundError, ProviderNotWorkingError
 from g4f.client import Client, AsyncClient, ChatCompletion, ChatCompletionChunk, get_model_and_provider
 from g4f.Provider.Copilot import Copilot
+from g4f.Provider.PollinationsAI import PollinationsAI
 from g4f.models import gpt_4o
 from .mocks import AsyncGeneratorProviderMock, ModelProviderMock, YieldProviderMock
 
@@ -137,5 +139,17 @@ class TestPassModel(unittest.TestCase):
         self.assertTrue(hasattr(provider, "create_completion"))
         self.assertEqual(model, gpt_4o.name)
 
+    def test_provider_list_not_shared(self):
+        providers = f"{Copilot.__name__} {PollinationsAI.__name__}"
+        _, provider = get_model_and_provider("", providers, False)
+        _, other_provider = get_model_and_provider("", providers, False)
+        self.assertIsNot(provider, other_provider)
+        self.assertEqual(provider.providers, [Copilot, PollinationsAI])
+
+    def test_provider_not_working(self):
+        get_model_and_provider("", Copilot, False)
+        with patch.object(Copilot, "working", False):
+            self.assertRaises(ProviderNotWorkingError, get_model_and_provider, "", Copilot, False)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,290 @@
+import os
+import asyncio
+import unittest
+import threading
+import concurrent.futures
+from unittest.mock import patch
+try:
+    import numpy
+    has_numpy = True
+except ImportError:
+    has_numpy = False
+
+from g4f.chat_completion import ChatCompletion
+from g4f.providers.asyncio import run_until_complete
+from g4f.providers.retry_provider import IterListProvider
+from g4f.requests.aiohttp import get_shared_connector
+
+from g4f.completions import cache
+from g4f.completions.cache import ResponseCache, cached_response, get_cache_key
+from g4f.completions.batcher import RequestBatcher, AsyncBatcher
+from g4f.completions import auto_continue
+from g4f.completions.auto_continue import is_response_incomplete, get_completion_check
+
+from .mocks import AsyncGeneratorProviderMock
+
+DEFAULT_MESSAGES = [{'role': 'user', 'content': 'Hello'}]
+
+class TestResponseCache(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.enabled = cache.enabled
+        cache.enabled = True
+        cache.response_cache.clear()
+        self.calls = 0
+
+    def tearDown(self) -> None:
+        cache.enabled = self.enabled
+        cache.response_cache.clear()
+
+    async def create(self, model, messages, provider=None, **kwargs):
+        self.calls += 1
+        return "Mock"
+
+    async def test_exact_hit(self):
+        create = cached_response(self.create)
+        self.assertEqual("Mock", await create("model", DEFAULT_MESSAGES))
+        self.assertEqual("Mock", await create("model", DEFAULT_MESSAGES))
+        self.assertEqual(1, self.calls)
+
+    async def test_miss_on_other_model(self):
+        create = cached_response(self.create)
+        await create("model", DEFAULT_MESSAGES)
+        await create("other", DEFAULT_MESSAGES)
+        self.assertEqual(2, self.calls)
+
+    async def test_stream_bypasses_cache(self):
+        create = cached_response(self.create)
+        await create("model", DEFAULT_MESSAGES, stream=True)
+        await create("model", DEFAULT_MESSAGES, stream=True)
+        self.assertEqual(2, self.calls)
+
+    async def test_semantic_scope(self):
+        if not has_numpy:
+            self.skipTest('"numpy" not installed')
+        semantic = cache.SemanticIndex(0.9)
+        def get_messages(question, follow_up):
+            return [{'role': 'user', 'content': question}, {'role': 'assistant', 'content': 'Mock'}, {'role': 'user', 'content': follow_up}]
+        create = cached_response(self.create)
+        with patch.object(cache, "np", numpy, create=True), \
+                patch.object(semantic, "encode", lambda text: numpy.array([1.0, 0.0])), \
+                patch.object(cache.response_cache, "semantic", semantic):
+            await create("model", get_messages("What is a list?", "Tell me more."))
+            await create("model", get_messages("What is a dict?", "Tell me more."))
+            self.assertEqual(2, self.calls)
+            await create("model", get_messages("What is a list?", "Tell me more!"))
+            self.assertEqual(2, self.calls)
+
+    def test_invalid_size(self):
+        with patch.dict(os.environ, {"G4F_RESPONSE_CACHE_SIZE": "many"}):
+            self.assertEqual(256, cache._get_number_env("G4F_RESPONSE_CACHE_SIZE", int, 256))
+
+    def test_lru_eviction(self):
+        response_cache = ResponseCache(max_size=1)
+        response_cache.set("a", "A")
+        response_cache.set("b", "B")
+        self.assertIsNone(response_cache.get("a"))
+        self.assertEqual("B", response_cache.get("b"))
+
+    def test_key_ignores_dict_order(self):
+        self.assertEqual(
+            get_cache_key("model", None, [{"role": "user", "content": "Hi"}]),
+            get_cache_key("model", None, [{"content": "Hi", "role": "user"}])
+        )
+
+class TestRequestBatcher(unittest.IsolatedAsyncioTestCase):
+
+    async def test_coalesce_identical_requests(self):
+        batcher = RequestBatcher(max_wait_ms=10)
+        calls = []
+        async def create():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "Mock"
+        results = await asyncio.gather(*[batcher.submit("key", create) for _ in range(3)])
+        self.assertEqual(["Mock"] * 3, results)
+        self.assertEqual(1, len(calls))
+
+    async def test_exception(self):
+        batcher = RequestBatcher(max_wait_ms=10)
+        async def create():
+            raise RuntimeError("Mock")
+        with self.assertRaises(RuntimeError):
+            await batcher.submit("key", create)
+
+class TestAsyncBatcher(unittest.IsolatedAsyncioTestCase):
+
+    async def test_batch(self):
+        batches = []
+        async def process(items):
+            batches.append(items)
+            return [item * 2 for item in items]
+        batcher = AsyncBatcher(process, max_wait_ms=10)
+        results = await asyncio.gather(*[batcher.submit(i) for i in range(3)])
+        self.assertEqual([0, 2, 4], results)
+        self.assertEqual([[0, 1, 2]], batches)
+
+    def test_event_loop_per_thread(self):
+        async def process(items):
+            await asyncio.sleep(0.01)
+            return [item * 2 for item in items]
+        batcher = AsyncBatcher(process, max_wait_ms=10)
+        async def submit_all(start):
+            return await asyncio.gather(*[batcher.submit(i) for i in range(start, start + 3)])
+        with concurrent.futures.ThreadPoolExecutor(4) as executor:
+            results = list(executor.map(lambda start: asyncio.run(submit_all(start)), range(0, 12, 3)))
+        self.assertEqual([[i * 2 for i in range(start, start + 3)] for start in range(0, 12, 3)], results)
+
+class TestIsResponseIncomplete(unittest.TestCase):
+
+    def test_complete(self):
+        self.assertFalse(is_response_incomplete("This is a complete sentence."))
+        self.assertFalse(is_response_incomplete("First sentence. Second sentence."))
+        self.assertFalse(is_response_incomplete("Here is the code:\n```python\nprint(1)\n```\nThat is all."))
+
+    def test_trailing_word(self):
+        self.assertTrue(is_response_incomplete("I went to the store and"))
+        self.assertTrue(is_response_incomplete("There are many options, such as "))
+        self.assertTrue(is_response_incomplete("This sentence is complete. " * 10 + "It is"))
+
+    def test_trailing_preposition(self):
+        self.assertTrue(is_response_incomplete("The answer depends on the context you are working in"))
+
+    def test_unbalanced(self):
+        self.assertTrue(is_response_incomplete("Call print(value."))
+        self.assertTrue(is_response_incomplete("Done.\n```python\nprint(1)\n"))
+
+    def test_long_terminal_ending(self):
+        text = "It's a long answer that keeps going for a while. " * 5
+        self.assertFalse(is_response_incomplete(text.strip()))
+        self.assertTrue(is_response_incomplete(text + "Continue with"))
+
+class TestCompletionCheck(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        auto_continue._completion_check_cache.clear()
+        self.calls = 0
+
+    def tearDown(self) -> None:
+        auto_continue._completion_check_cache.clear()
+
+    async def create_async(self, *args, **kwargs):
+        self.calls += 1
+        return "COMPLETE"
+
+    async def create_async_batch(self, *args, **kwargs):
+        self.calls += 1
+        return "1: COMPLETE\n2: INCOMPLETE"
+
+    async def test_skip_confident(self):
+        text = ("This sentence is long enough to be sent to the completeness checker. " * 4).strip()
+        with patch.object(ChatCompletion, "create_async", self.create_async):
+            self.assertTrue(await get_completion_check(text, "model"))
+        self.assertEqual(self.calls, 0)
+
+    async def test_skip_confident_boundary(self):
+        text = ("This sentence is long enough to be sent to the completeness checker. " * 3)[:199] + "."
+        self.assertEqual(len(text), auto_continue.SHORT_RESPONSE_LENGTH)
+        with patch.object(ChatCompletion, "create_async", self.create_async):
+            self.assertTrue(await get_completion_check(text, "model"))
+        self.assertEqual(self.calls, 0)
+
+    async def test_llm_check_disabled(self):
+        text = "This sentence is long enough to be sent to the completeness checker. " * 5 + "Done"
+        with patch.object(ChatCompletion, "create_async", self.create_async), \
+                patch.object(auto_continue, "llm_check_enabled", False):
+            self.assertTrue(await get_completion_check(text, "model"))
+        self.assertEqual(self.calls, 0)
+
+    async def test_cached_verdict(self):
+        text = "This sentence is long enough to be sent to the completeness checker. " * 5 + "Done"
+        with patch.object(ChatCompletion, "create_async", self.create_async):
+            self.assertTrue(await get_completion_check(text, "model"))
+            self.assertTrue(await get_completion_check(text, "model"))
+        self.assertEqual(self.calls, 1)
+
+    async def test_cached_tail(self):
+        text = "This sentence is long enough to be sent to the completeness checker. " * 20 + "Done"
+        with patch.object(ChatCompletion, "create_async", self.create_async):
+            self.assertTrue(await get_completion_check("First. " + text, "model"))
+            self.assertTrue(await get_completion_check("Second. " + text, "model"))
+        self.assertEqual(self.calls, 1)
+
+    async def test_timeout(self):
+        async def create_async(*args, **kwargs):
+            await asyncio.sleep(1)
+            return "INCOMPLETE"
+        text = "This sentence is long enough to be sent to the completeness checker. " * 5 + "Done"
+        with patch.object(ChatCompletion, "create_async", create_async), \
+                patch.object(auto_continue, "COMPLETION_CHECK_TIMEOUT", 0.05):
+            self.assertTrue(await get_completion_check(text, "model"))
+        self.assertEqual(len(auto_continue._completion_check_cache), 0)
+
+    async def test_checks_not_batched(self):
+        text = "This sentence is long enough to be sent to the completeness checker. " * 5
+        with patch.object(ChatCompletion, "create_async", self.create_async):
+            results = await asyncio.gather(
+                get_completion_check(text + "Done", "model"),
+                get_completion_check(text + "Fine", "model"),
+            )
+        self.assertEqual([True, True], results)
+        self.assertEqual(self.calls, 2)
+
+    async def test_batched_verdicts(self):
+        text = "This sentence is long enough to be sent to the completeness checker. " * 5
+        with patch.object(ChatCompletion, "create_async", self.create_async_batch), \
+                patch.object(auto_continue, "batch_checks_enabled", True):
+            results = await asyncio.gather(
+                get_completion_check(text + "Done", "model"),
+                get_completion_check(text + "Fine", "model"),
+            )
+        self.assertEqual([True, False], results)
+        self.assertEqual(self.calls, 1)
+
+class TestAutoContinue(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        auto_continue._completion_check_cache.clear()
+        self.calls = []
+
+    def create_async(self, *args, stream=False, **kwargs):
+        self.calls.append(stream)
+        if stream:
+            async def stream_response():
+                yield "The answer depends on "
+                yield "the context you are working in"
+            return stream_response()
+        async def response():
+            return "and the tools you use."
+        return response()
+
+    async def test_streaming(self):
+        with patch.object(ChatCompletion, "create_async", self.create_async), \
+                patch.object(auto_continue, "llm_check_enabled", False):
+            response = await auto_continue.auto_continue_response("model", DEFAULT_MESSAGES, "Provider", stream=True)
+            chunks = [chunk async for chunk in response]
+        self.assertEqual(chunks, ["The answer depends on ", "the context you are working in", "\nand the tools you use."])
+        self.assertEqual(self.calls, [True, False])
+
+    async def test_batchable(self):
+        with patch.object(ChatCompletion, "create_async", self.create_async):
+            response = await auto_continue.auto_continue_response("model", DEFAULT_MESSAGES, "Provider", max_attempts=1, batchable=True)
+        self.assertEqual(response, "and the tools you use.")
+
+class TestSharedConnector(unittest.TestCase):
+
+    def test_closed_with_thread_loop(self):
+        async def get_connector():
+            return get_shared_connector(), get_shared_connector()
+        connectors = []
+        thread = threading.Thread(target=lambda: connectors.extend(run_until_complete(get_connector())))
+        thread.start()
+        thread.join()
+        self.assertIs(connectors[0], connectors[1])
+        self.assertTrue(connectors[0].closed)
+
+    def test_accepts_connector_per_function(self):
+        auto_continue._has_connector_parameter.cache_clear()
+        for _ in range(3):
+            self.assertFalse(auto_continue._accepts_connector(IterListProvider([AsyncGeneratorProviderMock], False)))
+        self.assertEqual(auto_continue._has_connector_parameter.cache_info().currsize, 1)
@@ -25,6 +25,12 @@ class TestProviderHasModel(unittest.TestCase):
                 self.cache[provider.__name__] = provider.get_models()
             except (MissingRequirementsError, MissingAuthError):
                 return
+            except OSError:
+                # The model list could not be fetched
+                return
+            # Offline, providers that fetch their model list only know their defaults
+            if not getattr(provider, "_models_loaded", True):
+                self.cache[provider.__name__] = []
         if self.cache[provider.__name__]:
             self.assertIn(model, self.cache[provider.__name__], provider.__name__)
 
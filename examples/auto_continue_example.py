@@ -31,31 +31,24 @@ Make this extremely comprehensive and include technical details."""
     print("\n=== Using Auto-Continue (Enabled) ===")
     print(f"Query: {query[:100]}...\n")
     
-    response = await g4f.ChatCompletion.create_async(
+    # The initial response is returned as well, so the length without
+    # auto-continue can be shown without sending the query a second time
+    response, initial_response = await g4f.ChatCompletion.create_async(
         model="gpt-4o-mini",
         provider="Blackbox",
         auto_continue=True,
         completion_model="claude-3.7-sonnet",  # Using Claude to check completeness
+        return_intermediate=True,
         messages=[{"role": "user", "content": query}]
     )
     
     print(f"Response (Auto-Continue Enabled):\n{response}\n")
     
-    print("\n=== Using Standard Request (No Auto-Continue) ===")
-    response_no_continue = await g4f.ChatCompletion.create_async(
-        model="gpt-4o-mini",
-        provider="Blackbox",
-        auto_continue=False,
-        messages=[{"role": "user", "content": query}]
-    )
-    
-    print(f"Response (Auto-Continue Disabled):\n{response_no_continue}\n")
-    
     # Compare the lengths
     print("\n=== Comparison ===")
     print(f"Length with auto-continue: {len(response)} characters")
-    print(f"Length without auto-continue: {len(response_no_continue)} characters")
-    print(f"Difference: {len(response) - len(response_no_continue)} more characters with auto-continue")
+    print(f"Length without auto-continue: {len(initial_response)} characters")
+    print(f"Difference: {len(response) - len(initial_response)} more characters with auto-continue")
 
 async def stream_with_autocontinue():
     """Stream a response using the auto-continue feature."""
@@ -84,10 +77,11 @@ Make this extremely comprehensive and include technical details."""
     )
     
     # Print streaming response chunks
-    full_response = ""
+    chunks = []
     async for chunk in stream_response:
         print(chunk, end="", flush=True)
-        full_response += chunk
+        chunks.append(chunk)
+    full_response = "".join(chunks)
     
     print("\n\n=== Streaming Complete ===")
     print(f"Total response length: {len(full_response)} characters")
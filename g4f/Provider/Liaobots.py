@@ -245,7 +245,8 @@ class Liaobots(AsyncGeneratorProvider, ProviderModelMixin):
         async with ClientSession(
             headers=headers,
             cookie_jar=cls._cookie_jar,
-            connector=get_connector(connector, proxy, True)
+            connector=get_connector(connector, proxy, True),
+            connector_owner=connector is None
         ) as session:
             data = {
                 "conversationId": str(uuid.uuid4()),
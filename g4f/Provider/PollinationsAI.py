@@ -139,7 +139,7 @@ class PollinationsAI(AsyncGeneratorProvider, ProviderModelMixin):
         # Return unique models across all categories
         all_models = cls.text_models.copy()
         all_models.extend(cls.image_models)
-        all_models.extend(cls.audio_models.keys())
+        all_models.extend(cls.audio_models or [])
         return list(dict.fromkeys(all_models))
 
     @classmethod
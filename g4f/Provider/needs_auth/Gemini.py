@@ -167,7 +167,8 @@ class Gemini(AsyncGeneratorProvider, ProviderModelMixin):
 
         async with ClientSession(
             headers=REQUEST_HEADERS,
-            connector=base_connector
+            connector=base_connector,
+            connector_owner=connector is None
         ) as session:
             if not cls._snlm0e:
                 await cls.fetch_snlm0e(session, cls._cookies) if cls._cookies else None
@@ -195,6 +196,7 @@ class Gemini(AsyncGeneratorProvider, ProviderModelMixin):
                 cookies=cls._cookies,
                 headers=REQUEST_HEADERS,
                 connector=base_connector,
+                connector_owner=connector is None
             ) as client:
                 params = {
                     'bl': REQUEST_BL_PARAM,
@@ -362,7 +364,8 @@ class Gemini(AsyncGeneratorProvider, ProviderModelMixin):
         async def upload_image(image: bytes, image_name: str = None):
             async with ClientSession(
                 headers=UPLOAD_IMAGE_HEADERS,
-                connector=connector
+                connector=connector,
+                connector_owner=connector is None
             ) as session:
                 image = to_bytes(image)
 
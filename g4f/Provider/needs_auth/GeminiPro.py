@@ -85,7 +85,7 @@ class GeminiPro(AsyncGeneratorProvider, ProviderModelMixin):
 
         method = "streamGenerateContent" if stream else "generateContent"
         url = f"{api_base.rstrip('/')}/models/{model}:{method}"
-        async with ClientSession(headers=headers, connector=get_connector(connector, proxy)) as session:
+        async with ClientSession(headers=headers, connector=get_connector(connector, proxy), connector_owner=connector is None) as session:
             contents = [
                 {
                     "role": "model" if message["role"] == "assistant" else "user",
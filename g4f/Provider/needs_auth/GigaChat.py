@@ -93,11 +93,13 @@ class GigaChat(AsyncGeneratorProvider, ProviderModelMixin):
         if not cert_file.exists():
             cert_file.write_text(RUSSIAN_CA_CERT)
 
+        # A connector passed in belongs to the caller and stays open
+        connector_owner = connector is None
         if has_ssl and connector is None:
             ssl_context = ssl.create_default_context(cafile=str(cert_file))
             connector = TCPConnector(ssl_context=ssl_context)
 
-        async with ClientSession(connector=get_connector(connector, proxy)) as session:
+        async with ClientSession(connector=get_connector(connector, proxy), connector_owner=connector_owner) as session:
             if token_expires_at - int(time.time() * 1000) < 60000:
                 async with session.post(url="https://ngw.devices.sberbank.ru:9443/api/v2/oauth",
                                         headers={"Authorization": f"Bearer {api_key}",
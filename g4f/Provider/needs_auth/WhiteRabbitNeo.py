@@ -42,7 +42,8 @@ class WhiteRabbitNeo(AsyncGeneratorProvider):
         async with ClientSession(
             headers=headers,
             cookies=cookies,
-            connector=get_connector(connector, proxy)
+            connector=get_connector(connector, proxy),
+            connector_owner=connector is None
         ) as session:
             data = {
                 "messages": messages,
@@ -40,7 +40,7 @@ class AIChatFree(AsyncGeneratorProvider, ProviderModelMixin):
             "Origin": cls.url,
         }
         async with ClientSession(
-            connector=get_connector(connector, proxy), headers=headers
+            connector=get_connector(connector, proxy), connector_owner=connector is None, headers=headers
         ) as session:
             timestamp = int(time.time() * 1e3)
             data = {
@@ -44,7 +44,7 @@ class Koala(AsyncGeneratorProvider, ProviderModelMixin):
             "TE": "trailers",
         }
 
-        async with ClientSession(headers=headers, connector=get_connector(connector, proxy)) as session:
+        async with ClientSession(headers=headers, connector=get_connector(connector, proxy), connector_owner=connector is None) as session:
             input_text = messages[-1]["content"]
             system_messages = " ".join(
                 message["content"] for message in messages if message["role"] == "system"
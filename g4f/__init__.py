@@ -1,19 +1,10 @@
 from __future__ import annotations
 
-import os
 import logging
-from typing import Union, Optional, Coroutine, Dict, Any
+import importlib
+from typing import Any
 
 from . import debug, version
-from .models import Model, ModelUtils
-from .client import Client, AsyncClient
-from .typing import Messages, CreateResult, AsyncResult, ImageType
-from .errors import StreamNotSupportedError
-from .cookies import get_cookies, set_cookies
-from .providers.types import ProviderType
-from .providers.helper import concat_chunks, async_concat_chunks
-from .client.service import get_model_and_provider
-from .completions import auto_continue_response
 
 #Configure "g4f" logger
 logger = logging.getLogger(__name__)
@@ -23,150 +14,42 @@ logger.addHandler(log_handler)
 
 logger.setLevel(logging.ERROR)
 
-class ChatCompletion:
-    @staticmethod
-    def create(model    : Union[Model, str],
-               messages : Messages,
-               provider : Union[ProviderType, str, None] = None,
-               stream   : bool = False,
-               image    : ImageType = None,
-               image_name: Optional[str] = None,
-               ignore_working: bool = False,
-               ignore_stream: bool = False,
-               auto_continue: bool = True,
-               completion_model: Optional[str] = None,
-               continuation_attempts: Optional[int] = None,
-               **kwargs) -> Union[CreateResult, str]:
-        if image is not None:
-            kwargs["media"] = [(image, image_name)]
-        elif "images" in kwargs:
-            kwargs["media"] = kwargs.pop("images")
-        model, provider = get_model_and_provider(
-            model, provider, stream,
-            ignore_working,
-            ignore_stream,
-            has_images="media" in kwargs,
-        )
-        if "proxy" not in kwargs:
-            proxy = os.environ.get("G4F_PROXY")
-            if proxy:
-                kwargs["proxy"] = proxy
-        if ignore_stream:
-            kwargs["ignore_stream"] = True
-
-        # Skip auto-continue for streaming responses as that's handled separately
-        if auto_continue and not stream and not ignore_stream:
-            import asyncio
-            # Run in synchronous context
-            try:
-                return asyncio.run(auto_continue_response(
-                    model=model,
-                    messages=messages,
-                    provider=provider,
-                    completion_model=completion_model,
-                    max_attempts=continuation_attempts or 3,
-                    stream=stream,
-                    **kwargs
-                ))
-            except Exception as e:
-                # If auto-continue fails, try to find an alternative provider from the model's list
-                model_obj = None
-                if isinstance(model, str):
-                    for model_name, candidate_model in ModelUtils.convert.items():
-                        if model_name == model:
-                            model_obj = candidate_model
-                            break
-                else:
-                    model_obj = model
-                
-                if model_obj and model_obj.best_provider:
-                    logger.warning(f"Auto-continue failed with provider {provider.__name__ if hasattr(provider, '__name__') else type(provider).__name__}. Trying alternative providers.")
-                    # Try with the model's best_provider directly
-                    return asyncio.run(auto_continue_response(
-                        model=model if isinstance(model, str) else model.name,
-                        messages=messages,
-                        provider=model_obj.best_provider,
-                        completion_model=completion_model,
-                        max_attempts=continuation_attempts or 3,
-                        stream=stream,
-                        **kwargs
-                    ))
-                else:
-                    # If we can't find alternatives, re-raise the original error
-                    raise e
-        else:
-            result = provider.get_create_function()(model, messages, stream=stream, **kwargs)
-            return result if stream or ignore_stream else concat_chunks(result)
-
-    @staticmethod
-    def create_async(model    : Union[Model, str],
-                     messages : Messages,
-                     provider : Union[ProviderType, str, None] = None,
-                     stream   : bool = False,
-                     image    : ImageType = None,
-                     image_name: Optional[str] = None,
-                     ignore_stream: bool = False,
-                     ignore_working: bool = False,
-                     auto_continue: bool = True,
-                     completion_model: Optional[str] = None,
-                     continuation_attempts: Optional[int] = None,
-                     **kwargs) -> Union[AsyncResult, Coroutine[str]]:
-        if image is not None:
-            kwargs["media"] = [(image, image_name)]
-        elif "images" in kwargs:
-            kwargs["media"] = kwargs.pop("images")
-        model, provider = get_model_and_provider(model, provider, False, ignore_working, has_images="media" in kwargs)
-        if "proxy" not in kwargs:
-            proxy = os.environ.get("G4F_PROXY")
-            if proxy:
-                kwargs["proxy"] = proxy
-        if ignore_stream:
-            kwargs["ignore_stream"] = True
-
-        # Use auto-continue response if enabled
-        if auto_continue:
-            try:
-                return auto_continue_response(
-                    model=model,
-                    messages=messages,
-                    provider=provider,
-                    completion_model=completion_model,
-                    max_attempts=continuation_attempts or 3,
-                    stream=stream,
-                    **kwargs
-                )
-            except Exception as e:
-                # If auto-continue fails, try to find an alternative provider from the model's list
-                model_obj = None
-                if isinstance(model, str):
-                    for model_name, candidate_model in ModelUtils.convert.items():
-                        if model_name == model:
-                            model_obj = candidate_model
-                            break
-                else:
-                    model_obj = model
-                
-                if model_obj and model_obj.best_provider:
-                    logger.warning(f"Auto-continue failed with provider {provider.__name__ if hasattr(provider, '__name__') else type(provider).__name__}. Trying alternative providers.")
-                    # Try with the model's best_provider directly
-                    return auto_continue_response(
-                        model=model if isinstance(model, str) else model.name,
-                        messages=messages,
-                        provider=model_obj.best_provider,
-                        completion_model=completion_model,
-                        max_attempts=continuation_attempts or 3,
-                        stream=stream,
-                        **kwargs
-                    )
-                else:
-                    # If we can't find alternatives, re-raise the original error
-                    raise e
-        else:
-            # Use standard flow without auto-continue
-            result = provider.get_async_create_function()(model, messages, stream=stream, **kwargs)
-            
-            if not stream and not ignore_stream:
-                if hasattr(result, "__aiter__"):
-                    result = async_concat_chunks(result)
-                    
-            return result
\ No newline at end of file
+# Public names and the module they are imported from on first access (PEP 562)
+_LAZY_IMPORTS = {
+    "ChatCompletion": ".chat_completion",
+    "set_default_proxy": ".chat_completion",
+    "Model": ".models",
+    "ModelUtils": ".models",
+    "Client": ".client",
+    "AsyncClient": ".client",
+    "Messages": ".typing",
+    "CreateResult": ".typing",
+    "AsyncResult": ".typing",
+    "ImageType": ".typing",
+    "StreamNotSupportedError": ".errors",
+    "get_cookies": ".cookies",
+    "set_cookies": ".cookies",
+    "ProviderType": ".providers.types",
+    "concat_chunks": ".providers.helper",
+    "async_concat_chunks": ".providers.helper",
+    "get_model_and_provider": ".client.service",
+    "auto_continue_response": ".completions",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+# Submodules that were available as attributes after "import g4f"
+_LAZY_SUBMODULES = {"models", "client", "cookies", "typing", "errors", "providers", "completions", "Provider"}
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    elif name in _LAZY_SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS) | _LAZY_SUBMODULES)
@@ -10,6 +10,9 @@ from email.utils import formatdate
 import os.path
 import hashlib
 import asyncio
+import socket
+import signal
+import multiprocessing
 from urllib.parse import quote_plus
 from fastapi import FastAPI, Response, Request, UploadFile, Depends
 from fastapi.middleware.wsgi import WSGIMiddleware
@@ -135,6 +138,7 @@ class AppConfig:
     auto_continue: bool = True
     completion_model: str = None
     continuation_attempts: int = 3
+    backlog: int = 2048
 
     @classmethod
     def set_config(cls, **data):
@@ -675,12 +679,26 @@ def format_exception(e: Union[Exception, str], config: Union[ChatCompletionsConf
         )
     })
 
+def _bind_reuse_port(host: str, port: int) -> socket.socket:
+    sock = socket.socket(socket.AF_INET6 if ":" in host else socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+    return sock
+
+def _run_reuse_port_worker(config_kwargs: dict) -> None:
+    config = uvicorn.Config(**config_kwargs)
+    sock = _bind_reuse_port(config.host, config.port)
+    uvicorn.Server(config).run(sockets=[sock])
+
 def run_api(
     host: str = '0.0.0.0',
     port: int = None,
     bind: str = None,
     debug: bool = False,
     use_colors: bool = None,
+    workers: int = None,
+    reuse_port: bool = False,
     **kwargs
 ) -> None:
     print(f'Starting server... [g4f v-{g4f.version.utils.current_version}]' + (" (debug)" if debug else ""))
@@ -701,11 +719,37 @@ def run_api(
     else:
         method = "create_app_debug" if debug else "create_app"
     
-    uvicorn.run(
-        f"g4f.api:{method}",
+    config_kwargs = dict(
+        app=f"g4f.api:{method}",
         host=host,
         port=int(port),
         factory=True,
         use_colors=use_colors,
+        backlog=AppConfig.backlog,
         **filter_none(**kwargs)
     )
+
+    # With SO_REUSEPORT every worker binds its own socket and the kernel
+    # spreads incoming connections, instead of all workers sharing one.
+    if reuse_port and workers and workers > 1 and hasattr(socket, "SO_REUSEPORT") and not kwargs.get("reload"):
+        processes = [
+            multiprocessing.Process(target=_run_reuse_port_worker, args=(config_kwargs,))
+            for _ in range(workers)
+        ]
+        def stop_workers(signum, frame) -> None:
+            # SIGTERM lets the workers shut down gracefully, also after the SIGINT of the terminal
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+        for process in processes:
+            process.start()
+        previous_handlers = {signum: signal.signal(signum, stop_workers) for signum in (signal.SIGINT, signal.SIGTERM)}
+        try:
+            for process in processes:
+                process.join()
+        finally:
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
+        return
+
+    uvicorn.run(**config_kwargs, workers=workers)
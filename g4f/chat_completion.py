@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import os
+import logging
+from typing import Union, Optional, Coroutine
+
+from .models import Model, ModelUtils
+from .typing import Messages, CreateResult, AsyncResult, ImageType
+from .providers.types import ProviderType
+from .providers.helper import concat_chunks, async_concat_chunks
+from .providers.asyncio import run_until_complete
+from .client.service import get_model_and_provider
+
+logger = logging.getLogger(__name__)
+
+# Read once at import, use set_default_proxy to change it at runtime
+_DEFAULT_PROXY: Optional[str] = os.environ.get("G4F_PROXY")
+
+def set_default_proxy(proxy: Optional[str]) -> None:
+    """Set the proxy used by ChatCompletion when no "proxy" argument is given."""
+    global _DEFAULT_PROXY
+    _DEFAULT_PROXY = proxy
+
+def _prepare_kwargs(kwargs: dict, image: ImageType, image_name: Optional[str], ignore_stream: bool) -> dict:
+    """Apply the media, proxy and ignore_stream arguments shared by create and create_async."""
+    if image is not None:
+        kwargs["media"] = [(image, image_name)]
+    elif "images" in kwargs:
+        kwargs["media"] = kwargs.pop("images")
+    if "proxy" not in kwargs and _DEFAULT_PROXY:
+        kwargs["proxy"] = _DEFAULT_PROXY
+    if ignore_stream:
+        kwargs["ignore_stream"] = True
+    return kwargs
+
+def _normalize_messages(messages: Messages) -> Messages:
+    """Drop adjacent duplicate messages and merge consecutive system messages."""
+    normalized = []
+    for message in messages:
+        if normalized:
+            previous = normalized[-1]
+            if message == previous:
+                continue
+            if (message.get("role") == "system" and previous.get("role") == "system"
+                    and isinstance(message.get("content"), str) and isinstance(previous.get("content"), str)):
+                normalized[-1] = {**previous, "content": f"{previous['content']}\n\n{message['content']}"}
+                continue
+        normalized.append(message)
+    return normalized
+
+def _resolve_fallback(model: Union[Model, str]) -> tuple[str, Optional[Model]]:
+    """Return the model name and the Model object used to pick a fallback provider."""
+    if isinstance(model, str):
+        return model, ModelUtils.convert.get(model)
+    return model.name, model
+
+async def _auto_continue(model: Union[Model, str],
+                         messages: Messages,
+                         provider: ProviderType,
+                         completion_model: Optional[str],
+                         continuation_attempts: Optional[int],
+                         stream: bool,
+                         **kwargs) -> Union[AsyncResult, str]:
+    from .completions import auto_continue_response
+    try:
+        return await auto_continue_response(
+            model=model,
+            messages=messages,
+            provider=provider,
+            completion_model=completion_model,
+            max_attempts=continuation_attempts or 3,
+            stream=stream,
+            **kwargs
+        )
+    except Exception as e:
+        # If auto-continue fails, try the model's best_provider directly
+        model_name, model_obj = _resolve_fallback(model)
+        if model_obj is None or not model_obj.best_provider:
+            raise e
+        logger.warning("Auto-continue failed with provider %s. Trying alternative providers.", getattr(provider, "__name__", type(provider).__name__))
+        return await auto_continue_response(
+            model=model_name,
+            messages=messages,
+            provider=model_obj.best_provider,
+            completion_model=completion_model,
+            max_attempts=continuation_attempts or 3,
+            stream=stream,
+            **kwargs
+        )
+
+async def _auto_continue_iter(model: Union[Model, str],
+                              messages: Messages,
+                              provider: ProviderType,
+                              completion_model: Optional[str],
+                              continuation_attempts: Optional[int],
+                              **kwargs) -> AsyncResult:
+    """Stream the initial response and then its continuations, for create_async with return_async_iter."""
+    response = await _auto_continue(
+        model, messages, provider,
+        completion_model, continuation_attempts,
+        True, **kwargs
+    )
+    async for chunk in response:
+        yield chunk
+
+class ChatCompletion:
+    @staticmethod
+    def create(model    : Union[Model, str],
+               messages : Messages,
+               provider : Union[ProviderType, str, None] = None,
+               stream   : bool = False,
+               image    : ImageType = None,
+               image_name: Optional[str] = None,
+               ignore_working: bool = False,
+               ignore_stream: bool = False,
+               auto_continue: bool = True,
+               completion_model: Optional[str] = None,
+               continuation_attempts: Optional[int] = None,
+               **kwargs) -> Union[CreateResult, str]:
+        messages = _normalize_messages(messages)
+        kwargs = _prepare_kwargs(kwargs, image, image_name, ignore_stream)
+        model, provider = get_model_and_provider(
+            model, provider, stream,
+            ignore_working,
+            ignore_stream,
+            has_images="media" in kwargs,
+        )
+
+        # Skip auto-continue for streaming responses as that's handled separately
+        if auto_continue and not stream and not ignore_stream:
+            # Run in synchronous context
+            return run_until_complete(_auto_continue(
+                model, messages, provider,
+                completion_model, continuation_attempts,
+                stream, **kwargs
+            ))
+        else:
+            result = provider.get_create_function()(model, messages, stream=stream, **kwargs)
+            return result if stream or ignore_stream else concat_chunks(result)
+
+    @staticmethod
+    def create_async(model    : Union[Model, str],
+                     messages : Messages,
+                     provider : Union[ProviderType, str, None] = None,
+                     stream   : bool = False,
+                     image    : ImageType = None,
+                     image_name: Optional[str] = None,
+                     ignore_stream: bool = False,
+                     ignore_working: bool = False,
+                     auto_continue: bool = True,
+                     completion_model: Optional[str] = None,
+                     continuation_attempts: Optional[int] = None,
+                     return_async_iter: bool = False,
+                     **kwargs) -> Union[AsyncResult, Coroutine[str]]:
+        messages = _normalize_messages(messages)
+        kwargs = _prepare_kwargs(kwargs, image, image_name, ignore_stream)
+        model, provider = get_model_and_provider(model, provider, False, ignore_working, has_images="media" in kwargs)
+
+        # Use auto-continue response if enabled
+        if auto_continue and return_async_iter:
+            return _auto_continue_iter(
+                model, messages, provider,
+                completion_model, continuation_attempts,
+                **kwargs
+            )
+        elif auto_continue:
+            return _auto_continue(
+                model, messages, provider,
+                completion_model, continuation_attempts,
+                stream, **kwargs
+            )
+        else:
+            # Use standard flow without auto-continue
+            result = provider.get_async_create_function()(model, messages, stream=stream, **kwargs)
+            
+            # Hand out the chunks as they arrive instead of waiting for the full text
+            if not stream and not ignore_stream and not return_async_iter:
+                if hasattr(result, "__aiter__"):
+                    result = async_concat_chunks(result)
+                    
+            return result
\ No newline at end of file
@@ -8,6 +8,12 @@ from g4f.gui.run import gui_parser, run_gui_args
 import g4f.cookies
 from g4f.config import blacklist
 
+# Provider and browser names used as argparse choices, computed once
+_ALL_PROVIDERS = tuple(provider.__name__ for provider in Provider.__providers__)
+_WORKING_PROVIDERS = tuple(provider.__name__ for provider in Provider.__providers__ if provider.working)
+_IMAGE_PROVIDERS = tuple(provider.__name__ for provider in Provider.__providers__ if provider.working and hasattr(provider, "image_models"))
+_BROWSERS = tuple(browser.__name__ for browser in g4f.cookies.browsers)
+
 def get_api_parser():
     api_parser = ArgumentParser(description="Run the API and GUI")
     api_parser.add_argument("--bind", default=None, help="The bind string. (Default: 0.0.0.0:1337)")
@@ -15,18 +21,22 @@ def get_api_parser():
     api_parser.add_argument("--debug", "-d", action="store_true", help="Enable verbose logging.")
     api_parser.add_argument("--gui", "-g", default=None, action="store_true", help="Start also the gui.")
     api_parser.add_argument("--model", default=None, help="Default model for chat completion. (incompatible with --reload and --workers)")
-    api_parser.add_argument("--provider", choices=[provider.__name__ for provider in Provider.__providers__ if provider.working],
+    api_parser.add_argument("--provider", choices=_WORKING_PROVIDERS,
                             default=None, help="Default provider for chat completion. (incompatible with --reload and --workers)")
-    api_parser.add_argument("--image-provider", choices=[provider.__name__ for provider in Provider.__providers__ if provider.working and hasattr(provider, "image_models")],
+    api_parser.add_argument("--image-provider", choices=_IMAGE_PROVIDERS,
                             default=None, help="Default provider for image generation. (incompatible with --reload and --workers)"),
     api_parser.add_argument("--proxy", default=None, help="Default used proxy. (incompatible with --reload and --workers)")
     api_parser.add_argument("--workers", type=int, default=None, help="Number of workers.")
+    api_parser.add_argument("--reuse-port", action="store_true", default=False,
+                            help="Bind a SO_REUSEPORT socket per worker, on platforms that support it.")
+    api_parser.add_argument("--no-reuse-port", dest="reuse_port", action="store_false", help="Share one socket between the workers. (Default)")
+    api_parser.add_argument("--backlog", type=int, default=2048, help="Maximum number of pending connections per socket.")
     api_parser.add_argument("--disable-colors", action="store_true", help="Don't use colors.")
     api_parser.add_argument("--ignore-cookie-files", action="store_true", help="Don't read .har and cookie files. (incompatible with --reload and --workers)")
     api_parser.add_argument("--g4f-api-key", type=str, default=None, help="Sets an authentication key for your API. (incompatible with --reload and --workers)")
-    api_parser.add_argument("--ignored-providers", nargs="+", choices=[provider.__name__ for provider in Provider.__providers__ if provider.working],
+    api_parser.add_argument("--ignored-providers", nargs="+", choices=_WORKING_PROVIDERS,
                             default=[], help="List of providers to ignore when processing request. (incompatible with --reload and --workers)")
-    api_parser.add_argument("--cookie-browsers", nargs="+", choices=[browser.__name__ for browser in g4f.cookies.browsers],
+    api_parser.add_argument("--cookie-browsers", nargs="+", choices=_BROWSERS,
                             default=[], help="List of browsers to access or retrieve cookies from. (incompatible with --reload and --workers)")
     api_parser.add_argument("--reload", action="store_true", help="Enable reloading.")
     api_parser.add_argument("--demo", action="store_true", help="Enable demo mode.")
@@ -48,7 +58,7 @@ def get_blacklist_parser():
     # Add to blacklist
     add_parser = subparsers.add_parser("add", help="Add provider(s) to blacklist")
     add_parser.add_argument("providers", nargs="+", 
-                          choices=[provider.__name__ for provider in Provider.__providers__],
+                          choices=_ALL_PROVIDERS,
                           help="Provider name(s) to blacklist")
     
     # Remove from blacklist
@@ -97,6 +107,7 @@ def run_api_args(args):
         auto_continue=not args.disable_auto_continue,
         completion_model=args.completion_model,
         continuation_attempts=args.continuation_attempts,
+        backlog=args.backlog,
     )
     if args.cookie_browsers:
         g4f.cookies.browsers = [g4f.cookies[browser] for browser in args.cookie_browsers]
@@ -105,6 +116,7 @@ def run_api_args(args):
         port=args.port,
         debug=args.debug,
         workers=args.workers,
+        reuse_port=args.reuse_port,
         use_colors=not args.disable_colors,
         reload=args.reload,
         ssl_keyfile=args.ssl_keyfile,
@@ -121,8 +133,7 @@ def run_blacklist_args(args):
 
     if args.blacklist_cmd == "add":
         # Add providers to blacklist
-        for provider in args.providers:
-            blacklist.add_to_blacklist(provider)
+        blacklist.add_many_to_blacklist(args.providers)
         print(f"Added {len(args.providers)} provider(s) to blacklist")
         blacklisted = blacklist.get_blacklist()
         if blacklisted:
@@ -130,8 +141,7 @@ def run_blacklist_args(args):
     
     elif args.blacklist_cmd == "remove":
         # Remove providers from blacklist
-        for provider in args.providers:
-            blacklist.remove_from_blacklist(provider)
+        blacklist.remove_many_from_blacklist(args.providers)
         print(f"Removed {len(args.providers)} provider(s) from blacklist")
         blacklisted = blacklist.get_blacklist()
         if blacklisted:
@@ -144,14 +154,11 @@ def run_blacklist_args(args):
         blacklisted = blacklist.get_blacklist()
         if blacklisted:
             print(f"Blacklisted providers ({len(blacklisted)}):")
+            label_map = {name: getattr(provider, 'label', name) for name, provider in Provider.ProviderUtils.convert.items()}
             for provider in blacklisted:
-                try:
-                    if provider in Provider.ProviderUtils.convert:
-                        label = getattr(Provider.ProviderUtils.convert[provider], 'label', provider)
-                        print(f" - {provider}: {label}")
-                    else:
-                        print(f" - {provider}")
-                except:
+                if provider in label_map:
+                    print(f" - {provider}: {label_map[provider]}")
+                else:
                     print(f" - {provider}")
         else:
             print("No providers are blacklisted")
@@ -6,59 +6,160 @@ or incomplete, and automatically send follow-up requests to get the full respons
 """
 from __future__ import annotations
 
+import os
 import re
+import asyncio
+import hashlib
+import inspect
 import logging
-from typing import List, Optional, Callable, Any, Union, AsyncGenerator, Dict
+from collections import OrderedDict
+from functools import lru_cache
+from typing import List, Optional, Callable, Any, Union, AsyncGenerator, Dict, Tuple
 
 import g4f
 from g4f.typing import Messages, AsyncResult
 from g4f.errors import ProviderNotFoundError
 from g4f.providers.retry_provider import IterListProvider
+from g4f.requests.aiohttp import get_shared_connector
+from .cache import cached_response, get_cache_key
+from .batcher import batcher, AsyncBatcher
+
+try:
+    import regex
+    has_regex = True
+except ImportError:
+    has_regex = False
+
+try:
+    import numba
+    has_numba = True
+except ImportError:
+    has_numba = False
 
 logger = logging.getLogger(__name__)
 
-# Common patterns that indicate an incomplete response
-INCOMPLETE_PATTERNS = [
-    r'(?<!\w)(?<!\.)\.{2,}$',  # Ends with multiple dots (ellipsis)
-    r'(?<!\w),\s*$',           # Ends with a comma followed by optional whitespace
-    r'(?<!\w);$',              # Ends with a semicolon
-    r'\([^\)]*$',              # Contains an opening parenthesis with no matching closing parenthesis
-    r'\[[^\]]*$',              # Contains an opening bracket with no matching closing bracket
-    r'\{[^\}]*$',              # Contains an opening brace with no matching closing brace
-    r'"[^"]*$',                # Contains an opening double quote with no matching closing quote
-    r"'[^']*$",                # Contains an opening single quote with no matching closing quote
-    r'(?<!\w)and\s*$',         # Ends with "and" followed by optional whitespace
-    r'(?<!\w)or\s*$',          # Ends with "or" followed by optional whitespace
-    r'(?<!\w)but\s*$',         # Ends with "but" followed by optional whitespace
-    r'(?<!\w)so\s*$',          # Ends with "so" followed by optional whitespace
-    r'(?<!\w)because\s*$',     # Ends with "because" followed by optional whitespace
-    r'(?<!\w)then\s*$',        # Ends with "then" followed by optional whitespace
-    r'(?<!\w)that\s*$',        # Ends with "that" followed by optional whitespace
-    r'(?<!\w)which\s*$',       # Ends with "which" followed by optional whitespace
-    r'(?<!\w)additionally\s*$',# Ends with "additionally" followed by optional whitespace
-    r'(?<!\w)for\s+example\s*$',  # Ends with "for example" followed by optional whitespace
-    r'(?<!\w)such\s+as\s*$',      # Ends with "such as" followed by optional whitespace
-    r'(?<!\w)including\s*$',       # Ends with "including" followed by optional whitespace
-    r'^\s*\d+\.\s+[^\n]*$',    # Numbered list item without a following item
-    r'^\s*-\s+[^\n]*$',        # Bullet point without a following item
+# Common patterns that indicate an incomplete response.
+# Tail checks are grouped into alternations so each group is one search.
+
+# Anchored to the end of the response, searched in its tail only
+TAIL_INCOMPLETE_PATTERNS = [
+    # Ends with an ellipsis, a comma or a semicolon
+    r'(?<!\w)(?:(?<!\.)\.{2,}|,\s*|;)$',
     # Claude-specific pattern for mid-sentence truncation
     r'(?<!\w)(?<!\.)$',        # Response ends mid-sentence without punctuation
-    r'if\s+you\s+have\s+any.*?$',  # Ends with partial closing statement
-    r'hope\s+this\s+helps.*?$',    # Ends with partial closing statement
-    r'(?<!\w)(to|with|by|in|on|at|from|as|for|about|through|like|into)\s+$', # Ends with preposition
-    r'(?<!\w)(is|am|are|was|were|be|been|being)\s+$',  # Ends with form of "to be"
-    r'(?<!\w)(a|an|the)\s+$',  # Ends with article
-    r'(?<!\w)(if|unless|while|when|whenever|wherever|because|since|as|although|though|even though|whereas|whether|rather|until)\s+$',  # Ends with subordinating conjunction
-    r'(?<!\w)(can|could|may|might|must|shall|should|will|would)\s+$',  # Ends with modal verb
-    r'(?<!\w)(let me know|please let me|do you have|would you like|if you need)\s+$', # Ends with transitional phrase
-    r'(?<!\w)(by implementing|by using|next steps)\s+$', # Ends with instructional transition
-    r'(?<!\w)(I(\s+would)?(\s+recommend)?|You(\s+should)?|We(\s+can)?)\s+$', # Ends with recommendation start
 ]
 
+# Words and phrases that don't end a response, looked up in its last three words
+INCOMPLETE_TRAILING_WORDS = frozenset({
+    # Conjunctions and introductory words
+    "and", "or", "but", "so", "because", "then", "that", "which", "additionally", "including",
+    # Prepositions
+    "to", "with", "by", "in", "on", "at", "from", "as", "for", "about", "through", "like", "into",
+    # Forms of "to be"
+    "is", "am", "are", "was", "were", "be", "been", "being",
+    # Articles
+    "a", "an", "the",
+    # Subordinating conjunctions
+    "if", "unless", "while", "when", "whenever", "wherever", "since", "although", "though",
+    "whereas", "whether", "rather", "until",
+    # Modal verbs
+    "can", "could", "may", "might", "must", "shall", "should", "will", "would",
+    # Recommendation starts
+    "I", "You", "We",
+})
+INCOMPLETE_TRAILING_PHRASES = frozenset({
+    "for example", "such as", "even though",
+    # Transitional and instructional phrases
+    "let me know", "please let me", "do you have", "would you like", "if you need",
+    "by implementing", "by using", "next steps",
+    # Recommendation starts
+    "I would", "I recommend", "I would recommend", "You should", "We can",
+})
+
+# Can only match within the last line, searched there only
+LAST_LINE_INCOMPLETE_PATTERNS = [
+    r'(?:if\s+you\s+have\s+any|hope\s+this\s+helps).*?$',  # Ends with partial closing statement
+]
+
+# Searched in the whole response
+FULL_TEXT_INCOMPLETE_PATTERNS = [
+    # Contains an opening parenthesis, bracket, brace or quote with no matching close
+    r'(?:\([^\)]*|\[[^\]]*|\{[^\}]*|"[^"]*|\'[^\']*)$',
+    r'^\s*\d+\.\s+[^\n]*$',    # Numbered list item without a following item
+    r'^\s*-\s+[^\n]*$',        # Bullet point without a following item
+]
+
+INCOMPLETE_PATTERNS = TAIL_INCOMPLETE_PATTERNS + LAST_LINE_INCOMPLETE_PATTERNS + FULL_TEXT_INCOMPLETE_PATTERNS
+
+# Compiled once at import instead of going through the re module cache on every check.
+# With the "regex" module, matching releases the GIL, so checks in other threads run in parallel.
+if has_regex:
+    _compile_pattern = regex.compile
+    def _search(pattern, text: str):
+        return pattern.search(text, concurrent=True)
+else:
+    _compile_pattern = re.compile
+    def _search(pattern, text: str):
+        return pattern.search(text)
+
+def _compile_union(patterns: List[str]):
+    # One capturing group per pattern, so lastindex tells which one matched
+    return _compile_pattern("|".join(f"({pattern})" for pattern in patterns))
+
+# Each group is a single alternation, so the text is scanned once per group
+COMPILED_TAIL_PATTERN = _compile_union(TAIL_INCOMPLETE_PATTERNS)
+COMPILED_LAST_LINE_PATTERN = _compile_union(LAST_LINE_INCOMPLETE_PATTERNS)
+COMPILED_FULL_TEXT_PATTERN = _compile_union(FULL_TEXT_INCOMPLETE_PATTERNS)
+
+# Characters before the last non-whitespace character that the tail patterns see
+TAIL_LENGTH = 256
+
+# Regexes used by the sentence and ending checks
+# Matches up to the start of the last sentence, the greedy .* backtracks from the end
+LAST_SENTENCE_START_PATTERN = re.compile(r'.*[.!?]\s+', re.DOTALL)
+SHORT_RESPONSE_END_PATTERN = re.compile(r'[.!?:]$')
+# The last three words, the first and second are None for shorter endings
+LAST_WORDS_PATTERN = re.compile(r'(?<!\w)(?:(?:(\w+)\s+)?(\w+)\s+)?(\w+)\s*$')
+
+# Responses shorter than this that end on terminal punctuation are considered complete
+SHORT_RESPONSE_LENGTH = 200
+TERMINAL_ENDING_PATTERN = re.compile(r'[.!?)"\'\]]\s*$')
+# Endings of longer responses that skip the full-text checks of is_response_incomplete
+TERMINAL_CHARACTERS = frozenset('.!?"\'')
+
+# Set G4F_COMPLETION_CHECK_LLM=0 to decide completeness with the heuristics only
+llm_check_enabled: bool = os.environ.get("G4F_COMPLETION_CHECK_LLM", "1") not in ("0", "false", "False")
+# Set G4F_COMPLETION_CHECK_BATCH=1 to merge concurrent checks into one LLM call.
+# The classifier then sees the responses of unrelated requests in one prompt.
+batch_checks_enabled: bool = os.environ.get("G4F_COMPLETION_CHECK_BATCH", "0") not in ("0", "false", "False")
+# LLM verdicts of get_completion_check, keyed on the model and the classifier's input
+COMPLETION_CHECK_CACHE_SIZE = 512
+# Seconds to wait for the completion model before falling back to the heuristics
+COMPLETION_CHECK_TIMEOUT = 10
+# Characters from the end of the response sent to the completion model
+COMPLETION_CHECK_TAIL_LENGTH = 1024
+# One "<number>: COMPLETE" line per text in a batched completeness check
+BATCH_VERDICT_PATTERN = re.compile(r'^\W*(?:text\s*)?(\d+)\W*?\b(COMPLETE|INCOMPLETE)\b', re.MULTILINE | re.IGNORECASE)
+_completion_check_cache: "OrderedDict[Tuple[str, str, bytes], bool]" = OrderedDict()
+
 MAX_CONTINUATION_ATTEMPTS = 3
 # Fallback completion model if the current model can't be used
 DEFAULT_COMPLETION_MODEL = "claude-3.7-sonnet"
 
+# Continuation prompts for model families, matched against the lowercased model name in order
+CONTINUATION_PROMPTS = {
+    # Claude-specific prompts
+    "claude": "Please continue your response exactly from where you left off, completing any incomplete sentences or thoughts. Do not repeat information you've already provided and do not summarize. Just continue as if you were never interrupted.",
+    # GPT-specific prompts
+    "gpt": "Continue from where you left off. Do not repeat anything you've already said.",
+}
+# Default prompt for other models
+DEFAULT_CONTINUATION_PROMPT = "Continue from where you left off."
+
+def get_provider_name(provider: Any) -> str:
+    """Get the name of a provider class or instance for log messages."""
+    return getattr(provider, '__name__', None) or type(provider).__name__
+
 def get_provider_specific_model_name(model: str, provider: Any) -> str:
     """
     Convert a standard model name to the provider-specific model name.
@@ -76,39 +177,114 @@ def get_provider_specific_model_name(model: str, provider: Any) -> str:
     # No provider specified, return the original model name
     if provider is None:
         return model
-    
+    return _resolve_model_alias(model, provider)
+
+@lru_cache(maxsize=1024)
+def _resolve_model_alias(model: str, provider: Any) -> str:
+    """Look up model in the provider's model aliases, the result is fixed for each pair."""
     # For Blackbox provider, check model aliases
-    if hasattr(provider, 'model_aliases') and model.lower() in {k.lower() for k in provider.model_aliases}:
+    model_aliases = getattr(provider, 'model_aliases', None)
+    if model_aliases:
         # Find the case-insensitive match and return the properly aliased model name
-        for k, v in provider.model_aliases.items():
-            if k.lower() == model.lower():
-                logger.info(f"Converting model name '{model}' to provider-specific name '{v}' for {provider.__name__ if hasattr(provider, '__name__') else type(provider).__name__}")
+        lowered = model.lower()
+        for k, v in model_aliases.items():
+            if k.lower() == lowered:
+                logger.info("Converting model name '%s' to provider-specific name '%s' for %s", model, v, get_provider_name(provider))
                 return v
     
     return model
 
-def is_balanced(text: str, open_char: str, close_char: str) -> bool:
-    """Check if opening/closing characters (like brackets) are balanced."""
-    count = 0
-    for char in text:
-        if char == open_char:
-            count += 1
-        elif char == close_char:
-            count -= 1
-            if count < 0:
-                return False
-    return count == 0
+def _accepts_connector(provider: Any) -> bool:
+    """Check if the provider's create function takes an aiohttp "connector" argument."""
+    create_function = getattr(provider, "create_async_generator", None) or getattr(provider, "create_async", None)
+    if create_function is None:
+        return False
+    # Keyed on the function, not on the bound method, as retry providers are built per request
+    return _has_connector_parameter(getattr(create_function, "__func__", create_function))
+
+@lru_cache(maxsize=None)
+def _has_connector_parameter(function: Callable) -> bool:
+    try:
+        return "connector" in inspect.signature(function).parameters
+    except (TypeError, ValueError):
+        return False
+
+def with_shared_connector(provider: Any, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Add the shared connection pool to the request arguments.
+
+    The initial request and continuation attempts then reuse keep-alive
+    connections instead of opening a new TCP/TLS connection per request.
+    Completion checks don't know their provider and use their own connections.
+    Providers don't close a connector passed to them, it is closed with its loop.
+    Requests with a proxy or their own connector are left unchanged.
+    """
+    if kwargs.get("proxy") or kwargs.get("connector") or not _accepts_connector(provider):
+        return kwargs
+    return {**kwargs, "connector": get_shared_connector()}
+
+# Lowercased model names, built on first use and rebuilt when the registry changes size
+_model_lookup: Dict[str, g4f.models.Model] = {}
+_model_lookup_size: int = -1
+
+def find_model(model: str) -> Optional[g4f.models.Model]:
+    """Look up a model by name, ignoring case."""
+    global _model_lookup, _model_lookup_size
+    convert = g4f.models.ModelUtils.convert
+    model_obj = convert.get(model)
+    if model_obj is None:
+        if len(convert) != _model_lookup_size:
+            _model_lookup = {}
+            # setdefault keeps the first of several names that differ only in case
+            for name, obj in convert.items():
+                _model_lookup.setdefault(name.lower(), obj)
+            _model_lookup_size = len(convert)
+        model_obj = _model_lookup.get(model.lower())
+    return model_obj
+
+if has_numba:
+    @numba.njit(cache=True)
+    def _scan_bytes(data: bytes) -> Tuple[int, int, int, int, int, int, int]:
+        open_parens = close_parens = open_brackets = close_brackets = open_braces = close_braces = fences = 0
+        backticks = 0
+        for byte in data:
+            if byte == 96:
+                backticks += 1
+                if backticks == 3:
+                    fences += 1
+                    backticks = 0
+                continue
+            backticks = 0
+            if byte == 40:
+                open_parens += 1
+            elif byte == 41:
+                close_parens += 1
+            elif byte == 91:
+                open_brackets += 1
+            elif byte == 93:
+                close_brackets += 1
+            elif byte == 123:
+                open_braces += 1
+            elif byte == 125:
+                close_braces += 1
+        return open_parens, close_parens, open_brackets, close_brackets, open_braces, close_braces, fences
+
+    def _scan_counts(text: str) -> Tuple[int, int, int, int, int, int, int]:
+        # Brackets and backticks are ASCII, so they never occur inside multi-byte UTF-8 sequences
+        return _scan_bytes(text.encode("utf-8", "ignore"))
+else:
+    def _scan_counts(text: str) -> Tuple[int, int, int, int, int, int, int]:
+        return (
+            text.count('('), text.count(')'),
+            text.count('['), text.count(']'),
+            text.count('{'), text.count('}'),
+            text.count("```"),
+        )
 
 def is_code_block_complete(text: str) -> bool:
     """Check if all code blocks are properly closed."""
-    pattern = r'```[\w]*\n[\s\S]*?```'
-    matches = re.findall(pattern, text)
-    
-    # Count the number of code block openings and closings
-    open_blocks = len(re.findall(r'```[\w]*\n', text))
-    close_blocks = len(re.findall(r'```$', text, re.MULTILINE))
-    
-    return open_blocks == close_blocks
+    # Every fence opens or closes a block, so an odd count leaves one open
+    return text.count("```") % 2 == 0
 
 def is_response_incomplete(text: str) -> bool:
     """
@@ -120,49 +296,96 @@ def is_response_incomplete(text: str) -> bool:
     Returns:
         True if the response appears incomplete, False otherwise
     """
-    # Check for basic patterns that suggest an incomplete response
-    for pattern in INCOMPLETE_PATTERNS:
-        if re.search(pattern, text):
-            logger.info(f"Detected incomplete pattern: {pattern}")
-            return True
+    # Cheapest checks first, every check returns True on its own.
+    # Brackets and code fences are counted in one pass with numba, or with str.count
+    open_parens, close_parens, open_brackets, close_brackets, open_braces, close_braces, fences = _scan_counts(text)
+
+    # Check for incomplete code blocks, every fence opens or closes a block
+    if fences % 2:
+        logger.info("Detected incomplete code blocks")
+        return True
 
     # Check for unbalanced parentheses, brackets, braces, etc.
-    if not is_balanced(text, '(', ')'):
+    if open_parens != close_parens:
         logger.info("Detected unbalanced parentheses")
         return True
-    if not is_balanced(text, '[', ']'):
+    if open_brackets != close_brackets:
         logger.info("Detected unbalanced brackets")
         return True
-    if not is_balanced(text, '{', '}'):
+    if open_braces != close_braces:
         logger.info("Detected unbalanced braces")
         return True
-    
-    # Check for incomplete code blocks
-    if not is_code_block_complete(text):
-        logger.info("Detected incomplete code blocks")
-        return True
+
+    # End-anchored patterns can only match near the end, so skip the rest of the text
+    text_length = len(text)
+    stripped = text.rstrip()
+    tail = text[max(0, len(stripped) - TAIL_LENGTH):]
+
+    # A long, balanced response ending on terminal punctuation is only checked for a truncated ending
+    if len(stripped) > SHORT_RESPONSE_LENGTH and stripped[-1] in TERMINAL_CHARACTERS:
+        match = _search(COMPILED_TAIL_PATTERN, tail)
+        if match:
+            logger.info("Detected incomplete pattern: %s", TAIL_INCOMPLETE_PATTERNS[match.lastindex - 1])
+            return True
+        return False
+
+    last_line = text[text.rfind('\n', 0, text_length - 1) + 1:]
+
+    # Check for words and phrases that don't end a response
+    match = LAST_WORDS_PATTERN.search(tail)
+    if match:
+        words = [word for word in match.groups() if word is not None]
+        if words[-1] in INCOMPLETE_TRAILING_WORDS:
+            logger.info("Detected response ending with %r", words[-1])
+            return True
+        for start in range(len(words) - 1):
+            phrase = " ".join(words[start:])
+            if phrase in INCOMPLETE_TRAILING_PHRASES:
+                logger.info("Detected response ending with %r", phrase)
+                return True
+
+    # Check for basic patterns that suggest an incomplete response
+    for union, patterns, region in (
+        (COMPILED_TAIL_PATTERN, TAIL_INCOMPLETE_PATTERNS, tail),
+        (COMPILED_LAST_LINE_PATTERN, LAST_LINE_INCOMPLETE_PATTERNS, last_line),
+        (COMPILED_FULL_TEXT_PATTERN, FULL_TEXT_INCOMPLETE_PATTERNS, text),
+    ):
+        match = _search(union, region)
+        if match:
+            logger.info("Detected incomplete pattern: %s", patterns[match.lastindex - 1])
+            return True
     
     # Check for sentences that end abruptly or cut off
-    sentences = re.split(r'(?<=[.!?])\s+', text)
-    if sentences and len(sentences[-1]) > 5 and not re.search(r'[.!?]$', sentences[-1]):
-        logger.info("Detected sentence ending abruptly")
-        return True
+    # A text ending on terminal punctuation can't, only then is the last sentence looked up
+    if text_length > 5 and not stripped.endswith(('.', '!', '?')):
+        match = LAST_SENTENCE_START_PATTERN.match(tail)
+        if len(tail) - (match.end() if match else 0) > 5:
+            logger.info("Detected sentence ending abruptly")
+            return True
     
     # Additional check for responses that seem too short to be complete
     word_count = len(text.split())
     
     # If the response is very short and doesn't end with punctuation, it's likely incomplete
-    if word_count < 50 and not re.search(r'[.!?:]$', text.strip()):
+    if word_count < 50 and not SHORT_RESPONSE_END_PATTERN.search(stripped):
         logger.info("Detected short response without proper ending punctuation")
         return True
     
-    # Check for ending with a non-terminal conjunction or preposition
-    if re.search(r'(?<!\w)(in|on|at|to|with|from|as|by|for|about|like|through)\s*$', text):
-        logger.info("Detected response ending with non-terminal preposition")
-        return True
-    
     return False
 
+def _has_complete_ending(text: str) -> bool:
+    """Check if a response that passed the heuristics ends clearly enough to skip the LLM."""
+    # Short answers that end on terminal punctuation
+    if len(text) < SHORT_RESPONSE_LENGTH:
+        return TERMINAL_ENDING_PATTERN.search(text) is not None
+    # Longer ones that end a sentence
+    return text.rstrip().endswith(('.', '!', '?'))
+
+def _set_completion_check(key: Tuple[str, str, bytes], is_complete: bool) -> None:
+    _completion_check_cache[key] = is_complete
+    if len(_completion_check_cache) > COMPLETION_CHECK_CACHE_SIZE:
+        _completion_check_cache.popitem(last=False)
+
 async def get_completion_check(text: str, model: str) -> bool:
     """
     Use an LLM to determine if a response is complete.
@@ -177,41 +400,137 @@ async def get_completion_check(text: str, model: str) -> bool:
     # First check with heuristics for efficiency
     if is_response_incomplete(text):
         return False
-        
+
+    # Only ambiguous responses are sent to the LLM
+    if not llm_check_enabled or _has_complete_ending(text):
+        return True
+
+    # Only the end of a response shows if it was cut off, so the classifier gets the tail
+    if len(text) > COMPLETION_CHECK_TAIL_LENGTH:
+        excerpt = text[-COMPLETION_CHECK_TAIL_LENGTH:]
+        description = "text excerpt (tail of a longer response)"
+    else:
+        excerpt = text
+        description = "text"
+
+    # Skip the LLM for input it already classified, only the tail is hashed
+    cache_key = (model, description, hashlib.blake2b(excerpt.encode(), digest_size=16).digest())
+    if cache_key in _completion_check_cache:
+        _completion_check_cache.move_to_end(cache_key)
+        return _completion_check_cache[cache_key]
+
     try:
-        messages = [
-            {
-                "role": "system", 
-                "content": "You are an AI completeness detector. Your task is to determine if the provided text appears to be a complete response or if it seems to be cut off mid-response or incomplete in any way. Pay close attention to whether the response finishes its thoughts and provides a proper conclusion. Respond with ONLY 'COMPLETE' or 'INCOMPLETE'."
-            },
-            {
-                "role": "user", 
-                "content": f"Analyze the following text and determine if it's a complete response or if it appears to be cut off or incomplete in any way:\n\n{text}"
-            }
-        ]
-        
-        response = await g4f.ChatCompletion.create_async(
-            model=model,
-            messages=messages,
-            stream=False
-        )
+        if batch_checks_enabled:
+            check = _classifier_batcher.submit((model, excerpt, description))
+        else:
+            check = _classify(model, excerpt, description)
+        is_complete = await asyncio.wait_for(check, COMPLETION_CHECK_TIMEOUT)
+        if isinstance(is_complete, Exception):
+            raise is_complete
         
         # Look for definitive markers in the response
-        if "INCOMPLETE" in response.upper():
-            logger.info(f"LLM determined response is incomplete")
+        if is_complete is False:
+            logger.info("LLM determined response is incomplete")
+            _set_completion_check(cache_key, False)
             return False
-        elif "COMPLETE" in response.upper():
-            logger.info(f"LLM determined response is complete")
+        elif is_complete:
+            logger.info("LLM determined response is complete")
+            _set_completion_check(cache_key, True)
             return True
         else:
             # Default to heuristic check if the LLM response is unclear
-            logger.info(f"LLM response unclear, using heuristic check")
+            logger.info("LLM response unclear, using heuristic check")
             return not is_response_incomplete(text)
+    except asyncio.TimeoutError:
+        logger.warning("LLM completion check timed out after %s seconds, using heuristic check", COMPLETION_CHECK_TIMEOUT)
+        return not is_response_incomplete(text)
     except Exception as e:
-        logger.warning(f"Error using LLM to check completion status: {e}")
+        logger.warning("Error using LLM to check completion status: %s", e)
         # Fall back to heuristic check if LLM check fails
         return not is_response_incomplete(text)
 
+def _parse_verdict(response: str) -> Optional[bool]:
+    """Read a COMPLETE / INCOMPLETE answer, None if it has neither."""
+    response = response.upper()
+    if "INCOMPLETE" in response:
+        return False
+    elif "COMPLETE" in response:
+        return True
+    return None
+
+async def _classify(model: str, excerpt: str, description: str) -> Optional[bool]:
+    messages = [
+        {
+            "role": "system", 
+            "content": "You are an AI completeness detector. Your task is to determine if the provided text appears to be a complete response or if it seems to be cut off mid-response or incomplete in any way. Pay close attention to whether the response finishes its thoughts and provides a proper conclusion. Respond with ONLY 'COMPLETE' or 'INCOMPLETE'."
+        },
+        {
+            "role": "user", 
+            "content": f"Analyze the following {description} and determine if it's a complete response or if it appears to be cut off or incomplete in any way:\n\n{excerpt}"
+        }
+    ]
+    response = await g4f.ChatCompletion.create_async(
+        model=model,
+        messages=messages,
+        auto_continue=False,
+        stream=False
+    )
+    return _parse_verdict(response)
+
+async def _classify_many(model: str, items: List[Tuple[str, str]]) -> List[Optional[bool]]:
+    texts = "\n\n".join(
+        f"Text {index} ({description}):\n{excerpt}"
+        for index, (excerpt, description) in enumerate(items, 1)
+    )
+    messages = [
+        {
+            "role": "system", 
+            "content": "You are an AI completeness detector. Your task is to determine for each of the provided numbered texts if it appears to be a complete response or if it seems to be cut off mid-response or incomplete in any way. Pay close attention to whether each response finishes its thoughts and provides a proper conclusion. Respond with one line per text, formatted as '<number>: COMPLETE' or '<number>: INCOMPLETE', and nothing else."
+        },
+        {
+            "role": "user", 
+            "content": f"Analyze the following {len(items)} texts and determine for each if it's a complete response or if it appears to be cut off or incomplete in any way:\n\n{texts}"
+        }
+    ]
+    response = await g4f.ChatCompletion.create_async(
+        model=model,
+        messages=messages,
+        auto_continue=False,
+        stream=False
+    )
+    verdicts: List[Optional[bool]] = [None] * len(items)
+    for number, verdict in BATCH_VERDICT_PATTERN.findall(response):
+        index = int(number) - 1
+        if 0 <= index < len(items):
+            verdicts[index] = verdict.upper() == "COMPLETE"
+    return verdicts
+
+async def _classify_batch(items: List[Tuple[str, str, str]]) -> List[Union[bool, None, Exception]]:
+    """Classify (model, excerpt, description) items with one LLM call per completion model."""
+    by_model: Dict[str, List[int]] = {}
+    for index, (model, _, _) in enumerate(items):
+        by_model.setdefault(model, []).append(index)
+
+    async def classify_group(model: str, indexes: List[int]) -> List[Optional[bool]]:
+        if len(indexes) == 1:
+            _, excerpt, description = items[indexes[0]]
+            return [await _classify(model, excerpt, description)]
+        return await _classify_many(model, [items[index][1:] for index in indexes])
+
+    results: List[Union[bool, None, Exception]] = [None] * len(items)
+    groups = await asyncio.gather(
+        *(classify_group(model, indexes) for model, indexes in by_model.items()),
+        return_exceptions=True
+    )
+    for indexes, verdicts in zip(by_model.values(), groups):
+        for position, index in enumerate(indexes):
+            results[index] = verdicts if isinstance(verdicts, Exception) else verdicts[position]
+    return results
+
+# With batch_checks_enabled, completeness checks submitted within a short window share one LLM call per completion model
+_classifier_batcher = AsyncBatcher(_classify_batch, max_batch=16, max_wait_ms=30)
+
+@lru_cache(maxsize=256)
 def get_continuation_prompt(model: str) -> str:
     """
     Get a model-specific continuation prompt.
@@ -225,26 +544,85 @@ def get_continuation_prompt(model: str) -> str:
     Returns:
         A continuation prompt suitable for the model
     """
-    # Claude-specific prompts
-    if 'claude' in model.lower():
-        return "Please continue your response exactly from where you left off, completing any incomplete sentences or thoughts. Do not repeat information you've already provided and do not summarize. Just continue as if you were never interrupted."
-    
-    # GPT-specific prompts
-    elif 'gpt' in model.lower():
-        return "Continue from where you left off. Do not repeat anything you've already said."
-    
-    # Default prompt for other models
-    else:
-        return "Continue from where you left off."
+    model_lower = model.lower()
+    for family, prompt in CONTINUATION_PROMPTS.items():
+        if family in model_lower:
+            return prompt
+    return DEFAULT_CONTINUATION_PROMPT
+
+def get_candidate_providers(provider: Any, model_obj: Optional[g4f.models.Model]) -> List[Any]:
+    """
+    Get the providers to try for a request, in order and without duplicates.
+
+    The given provider comes first, followed by the providers of the model's
+    IterListProvider, or the model's best provider if it is a single provider.
+    """
+    candidates = [provider]
+    if model_obj is not None and model_obj.best_provider:
+        best_provider = model_obj.best_provider
+        if isinstance(best_provider, IterListProvider):
+            candidates.extend(best_provider.providers)
+        else:
+            candidates.append(best_provider)
+    return list(dict.fromkeys(candidates))
+
+async def _get_with_fallback(
+    model: str,
+    messages: Messages,
+    providers: List[Any],
+    **kwargs
+) -> Tuple[Union[str, AsyncResult], Any]:
+    """
+    Request a response from the first of providers that succeeds.
+
+    The provider that answered is moved to the front of providers,
+    so the next request starts with it.
+
+    Returns:
+        The response and the provider that returned it
 
+    Raises:
+        The error of the first provider if all providers fail
+    """
+    error = None
+    for index, provider in enumerate(providers):
+        provider_name = get_provider_name(provider)
+        if index > 0:
+            logger.info("Trying alternative provider %s for model %s", provider_name, model)
+        try:
+            response = g4f.ChatCompletion.create_async(
+                model=get_provider_specific_model_name(model, provider),
+                messages=messages,
+                provider=provider,
+                auto_continue=False,
+                **with_shared_connector(provider, kwargs)
+            )
+            # Streamed responses are async generators, errors only surface while iterating them
+            if not hasattr(response, "__aiter__") and inspect.isawaitable(response):
+                response = await response
+        except Exception as e:
+            if error is None:
+                logger.error("Request with provider %s failed: %s", provider_name, e)
+                error = e
+            else:
+                logger.error("Alternative provider %s also failed: %s", provider_name, e)
+            continue
+        if index > 0:
+            providers.insert(0, providers.pop(index))
+        return response, provider
+    raise error
+
+@cached_response
 async def auto_continue_response(
     model: str,
     messages: Messages,
     provider: Any = None,
     completion_model: Optional[str] = None,
     max_attempts: int = MAX_CONTINUATION_ATTEMPTS,
+    batchable: bool = False,
+    return_intermediate: bool = False,
     **kwargs
-) -> Union[str, AsyncResult]:
+) -> Union[str, Tuple[str, str], AsyncResult]:
     """
     Process a response and automatically continue it if it appears incomplete.
     
@@ -254,111 +632,34 @@ async def auto_continue_response(
         provider: The provider to use
         completion_model: The model to use for checking completion (defaults to current model if None)
         max_attempts: Maximum number of continuation attempts
+        batchable: Dispatch through the request batcher, coalescing identical concurrent requests
+        return_intermediate: Also return the initial response, before any continuation
         **kwargs: Additional arguments to pass to the create_async function
         
     Returns:
-        The complete response
+        The complete response, or a (complete, initial) tuple if return_intermediate is set
     """
     is_streaming = kwargs.get('stream', False)
-    full_response = ""
-    
+    if batchable and not is_streaming:
+        return await batcher.submit(
+            get_cache_key(model, provider, messages, completion_model=completion_model, max_attempts=max_attempts, return_intermediate=return_intermediate, **kwargs),
+            lambda: auto_continue_response(model, messages, provider, completion_model=completion_model, max_attempts=max_attempts, return_intermediate=return_intermediate, **kwargs)
+        )
     # Use the current model for completion check if not specified
     if completion_model is None:
         completion_model = model
     
     # Get the provider-specific model name
     provider_model = get_provider_specific_model_name(model, provider)
-    logger.info(f"Using provider {provider.__name__ if hasattr(provider, '__name__') else type(provider).__name__} with model {provider_model}")
+    provider_name = get_provider_name(provider)
+    logger.info("Using provider %s with model %s", provider_name, provider_model)
     
-    # Initial request
-    try:
-        response = await g4f.ChatCompletion.create_async(
-            model=provider_model,
-            messages=messages,
-            provider=provider,
-            **kwargs
-        )
-    except Exception as e:
-        logger.error(f"Error during initial request with provider {provider.__name__ if hasattr(provider, '__name__') else type(provider).__name__}: {e}")
-        # Try to get an alternative provider if there was an error
-        try:
-            # Get the model object to find alternative providers
-            model_obj = None
-            for model_name, model_obj in g4f.models.ModelUtils.convert.items():
-                if model_name.lower() == model.lower():
-                    break
-            
-            # If we found a model object and it has alternative providers
-            if model_obj and model_obj.best_provider:
-                if model_obj.best_provider != provider:
-                    # Try the best provider first if it's not the one that failed
-                    logger.info(f"Trying alternative provider {model_obj.best_provider.__name__ if hasattr(model_obj.best_provider, '__name__') else type(model_obj.best_provider).__name__} for model {model}")
-                    try:
-                        response = await g4f.ChatCompletion.create_async(
-                            model=get_provider_specific_model_name(model, model_obj.best_provider),
-                            messages=messages,
-                            provider=model_obj.best_provider,
-                            **kwargs
-                        )
-                        # Update provider for future continuation attempts
-                        provider = model_obj.best_provider
-                    except Exception as alt_e:
-                        logger.error(f"Alternative provider also failed: {alt_e}")
-                        # If best provider also fails, try other providers if available
-                        if isinstance(model_obj.best_provider, IterListProvider):
-                            for alt_provider in model_obj.best_provider.providers:
-                                # Skip providers we've already tried
-                                if alt_provider == provider:
-                                    continue
-                                
-                                logger.info(f"Trying provider {alt_provider.__name__ if hasattr(alt_provider, '__name__') else type(alt_provider).__name__} for model {model}")
-                                try:
-                                    response = await g4f.ChatCompletion.create_async(
-                                        model=get_provider_specific_model_name(model, alt_provider),
-                                        messages=messages,
-                                        provider=alt_provider,
-                                        **kwargs
-                                    )
-                                    # Update provider for future continuation attempts
-                                    provider = alt_provider
-                                    break
-                                except Exception as p_e:
-                                    logger.error(f"Provider {alt_provider.__name__ if hasattr(alt_provider, '__name__') else type(alt_provider).__name__} also failed: {p_e}")
-                                    continue
-                            else:
-                                # If we've tried all providers and none worked, re-raise the original error
-                                raise e
-                else:
-                    # If the best provider is the one that failed, try other providers if available
-                    if isinstance(model_obj.best_provider, IterListProvider):
-                        for alt_provider in model_obj.best_provider.providers:
-                            # Skip providers we've already tried
-                            if alt_provider == provider:
-                                continue
-                            
-                            logger.info(f"Trying provider {alt_provider.__name__ if hasattr(alt_provider, '__name__') else type(alt_provider).__name__} for model {model}")
-                            try:
-                                response = await g4f.ChatCompletion.create_async(
-                                    model=get_provider_specific_model_name(model, alt_provider),
-                                    messages=messages,
-                                    provider=alt_provider,
-                                    **kwargs
-                                )
-                                # Update provider for future continuation attempts
-                                provider = alt_provider
-                                break
-                            except Exception as p_e:
-                                logger.error(f"Provider {alt_provider.__name__ if hasattr(alt_provider, '__name__') else type(alt_provider).__name__} also failed: {p_e}")
-                                continue
-                        else:
-                            # If we've tried all providers and none worked, re-raise the original error
-                            raise e
-            else:
-                # Re-raise if we couldn't find an alternative
-                raise e
-        except Exception:
-            # If all alternatives fail, re-raise the original error
-            raise e
+    # Providers to try in order, built once for the initial request and all continuations
+    providers = get_candidate_providers(provider, find_model(model))
+
+    # Initial request, with the provider that answered used for continuations
+    response, provider = await _get_with_fallback(model, messages, providers, **kwargs)
+    provider_name = get_provider_name(provider)
     
     # Handle streaming response differently
     if is_streaming:
@@ -366,136 +667,70 @@ async def auto_continue_response(
             response, 
             model, 
             messages, 
-            provider, 
+            providers, 
             completion_model,
             max_attempts,
             **kwargs
         )
     
     # For non-streaming response
-    full_response = response
-    logger.info(f"Received initial response of length {len(full_response)} characters")
+    logger.info("Received initial response of length %d characters", len(response))
+    # Collected as a list and joined when needed, instead of growing one string
+    parts = [response]
     attempts = 0
+    continuation_kwargs = {k: v for k, v in kwargs.items() if k != 'stream'}
+    # Get the appropriate continuation prompt for this model, it is the same for every attempt
+    continuation_prompt = get_continuation_prompt(model)
+    logger.info("Using model-specific prompt for %s: %s...", model, continuation_prompt[:50])
+    continuation_message = {"role": "user", "content": continuation_prompt}
+    # Built once, only the assistant message is updated on each attempt
+    continuation_messages = [*messages, {"role": "assistant", "content": ""}, continuation_message]
     
     # Force check and continue requesting more content if needed
     # Always check at least once, even for seemingly complete responses
     is_complete = False
     while (not is_complete and attempts < max_attempts):
+        full_response = "\n".join(parts)
         # Check if response is complete
         is_complete = await get_completion_check(full_response, completion_model)
         if is_complete:
             logger.info("Response determined to be complete")
             break
             
-        logger.info(f"Detected incomplete response. Attempting continuation ({attempts+1}/{max_attempts})")
-        
-        # Get the appropriate continuation prompt for this model
-        continuation_prompt = get_continuation_prompt(model)
-        logger.info(f"Using model-specific prompt for {model}: {continuation_prompt[:50]}...")
+        logger.info("Detected incomplete response. Attempting continuation (%d/%d)", attempts + 1, max_attempts)
         
-        # Create continuation messages
-        continuation_messages = messages.copy()
-        continuation_messages.append({"role": "assistant", "content": full_response})
-        continuation_messages.append({"role": "user", "content": continuation_prompt})
+        # Update continuation messages
+        continuation_messages[-2]["content"] = full_response
         
         try:
             # Get continuation
-            logger.info(f"Requesting continuation from provider {provider.__name__ if hasattr(provider, '__name__') else type(provider).__name__}")
-            continuation = await g4f.ChatCompletion.create_async(
-                model=get_provider_specific_model_name(model, provider),
-                messages=continuation_messages,
-                provider=provider,
-                stream=False,
-                **{k: v for k, v in kwargs.items() if k != 'stream'}
+            logger.info("Requesting continuation from provider %s", provider_name)
+            continuation, provider = await _get_with_fallback(
+                model, continuation_messages, providers, stream=False, **continuation_kwargs
             )
-            
+            provider_name = get_provider_name(provider)
             # Append continuation to full response
-            logger.info(f"Received continuation of length {len(continuation)} characters")
-            full_response += "\n" + continuation
-            attempts += 1
-        except Exception as e:
-            logger.error(f"Error during continuation attempt with provider {provider.__name__ if hasattr(provider, '__name__') else type(provider).__name__}: {e}")
-            
-            # Try with a different provider
-            try:
-                # Get model object to find alternative providers
-                model_obj = None
-                for model_name, model_obj in g4f.models.ModelUtils.convert.items():
-                    if model_name.lower() == model.lower():
-                        break
-                
-                alternative_provider_found = False
-                # Check if we have a model object and if it has a best provider
-                if model_obj and model_obj.best_provider:
-                    # If the best provider is a list of providers (IterListProvider)
-                    if isinstance(model_obj.best_provider, IterListProvider):
-                        # Get a list of providers from the retry provider
-                        for alt_provider in model_obj.best_provider.providers:
-                            # Skip the provider that just failed
-                            if alt_provider == provider:
-                                continue
-                            
-                            logger.info(f"Trying alternative provider {alt_provider.__name__ if hasattr(alt_provider, '__name__') else type(alt_provider).__name__} for continuation")
-                            try:
-                                continuation = await g4f.ChatCompletion.create_async(
-                                    model=get_provider_specific_model_name(model, alt_provider),
-                                    messages=continuation_messages,
-                                    provider=alt_provider,
-                                    stream=False,
-                                    **{k: v for k, v in kwargs.items() if k != 'stream'}
-                                )
-                                # Append continuation to full response
-                                logger.info(f"Received continuation from alternative provider of length {len(continuation)} characters")
-                                full_response += "\n" + continuation
-                                # Update provider for future continuation attempts
-                                provider = alt_provider
-                                alternative_provider_found = True
-                                break
-                            except Exception as alt_e:
-                                logger.error(f"Alternative provider also failed: {alt_e}")
-                                continue
-                    # If the best provider is a single provider
-                    elif model_obj.best_provider != provider:
-                        # Try the best provider if it's not the one that failed
-                        logger.info(f"Trying alternative provider {model_obj.best_provider.__name__ if hasattr(model_obj.best_provider, '__name__') else type(model_obj.best_provider).__name__} for continuation")
-                        try:
-                            continuation = await g4f.ChatCompletion.create_async(
-                                model=get_provider_specific_model_name(model, model_obj.best_provider),
-                                messages=continuation_messages,
-                                provider=model_obj.best_provider,
-                                stream=False,
-                                **{k: v for k, v in kwargs.items() if k != 'stream'}
-                            )
-                            # Append continuation to full response
-                            logger.info(f"Received continuation from best provider of length {len(continuation)} characters")
-                            full_response += "\n" + continuation
-                            # Update provider for future continuation attempts
-                            provider = model_obj.best_provider
-                            alternative_provider_found = True
-                        except Exception as alt_e:
-                            logger.error(f"Alternative provider also failed: {alt_e}")
-                
-                # If no alternative provider was found or all failed, count this as a failed attempt
-                if not alternative_provider_found:
-                    logger.warning("No alternative provider was found or all failed")
-                    attempts += 1
-                    
-            except Exception:
-                # If all alternatives fail, count this as a failed attempt
-                logger.warning("Exception while trying to find alternative providers")
-                attempts += 1
+            logger.info("Received continuation of length %d characters", len(continuation))
+            parts.append(continuation)
+        except Exception:
+            # If all providers fail, count this as a failed attempt
+            logger.warning("No alternative provider was found or all failed")
+        attempts += 1
     
     # Final check if we couldn't get a complete response after maximum attempts
     if not is_complete:
-        logger.warning(f"Could not get a complete response after {max_attempts} attempts. Returning best effort.")
+        logger.warning("Could not get a complete response after %d attempts. Returning best effort.", max_attempts)
 
+    full_response = "\n".join(parts)
+    if return_intermediate:
+        return full_response, response
     return full_response
 
 async def _handle_streaming_response(
     response: AsyncResult,
     model: str,
     messages: Messages,
-    provider: Any,
+    providers: List[Any],
     completion_model: str,
     max_attempts: int,
     **kwargs
@@ -510,7 +745,7 @@ async def _handle_streaming_response(
         response: The initial streaming response
         model: The model to use for the initial and continuation responses
         messages: The conversation messages
-        provider: The provider to use
+        providers: The providers to try, starting with the one that returned the response
         completion_model: The model to use for checking completion
         max_attempts: Maximum number of continuation attempts
         **kwargs: Additional arguments to pass to the create_async function
@@ -518,133 +753,63 @@ async def _handle_streaming_response(
     Returns:
         AsyncGenerator yielding response chunks
     """
-    full_response = ""
+    chunks = []
     attempts = 0
     
     # Stream the initial response, collecting all chunks
     try:
         async for chunk in response:
-            full_response += chunk
+            chunks.append(chunk)
             # We stream the chunks directly since we'll handle completeness
             # after the entire initial response is received
             yield chunk
+        parts = ["".join(chunks)]
+        provider_name = get_provider_name(providers[0])
+        continuation_kwargs = {k: v for k, v in kwargs.items() if k != 'stream'}
+        # Get the appropriate continuation prompt for this model, it is the same for every attempt
+        continuation_prompt = get_continuation_prompt(model)
+        logger.info("Using model-specific prompt for %s: %s...", model, continuation_prompt[:50])
+        continuation_message = {"role": "user", "content": continuation_prompt}
+        # Built once, only the assistant message is updated on each attempt
+        continuation_messages = [*messages, {"role": "assistant", "content": ""}, continuation_message]
         
         # After getting the full initial response, check for completeness and continue if needed
         # Always check at least once, even for seemingly complete responses
         is_complete = False
         while (not is_complete and attempts < max_attempts):
+            full_response = "\n".join(parts)
             # Check if the response is complete
             is_complete = await get_completion_check(full_response, completion_model)
             if is_complete:
                 logger.info("Streaming response determined to be complete")
                 break
                 
-            logger.info(f"Detected incomplete streamed response. Attempting continuation ({attempts+1}/{max_attempts})")
-            
-            # Get the appropriate continuation prompt for this model
-            continuation_prompt = get_continuation_prompt(model)
-            logger.info(f"Using model-specific prompt for {model}: {continuation_prompt[:50]}...")
+            logger.info("Detected incomplete streamed response. Attempting continuation (%d/%d)", attempts + 1, max_attempts)
             
-            # Create continuation messages
-            continuation_messages = messages.copy()
-            continuation_messages.append({"role": "assistant", "content": full_response})
-            continuation_messages.append({"role": "user", "content": continuation_prompt})
+            # Update continuation messages
+            continuation_messages[-2]["content"] = full_response
             
             try:
                 # Get continuation (non-streaming for simplicity)
-                logger.info(f"Requesting continuation from provider {provider.__name__ if hasattr(provider, '__name__') else type(provider).__name__}")
-                continuation = await g4f.ChatCompletion.create_async(
-                    model=get_provider_specific_model_name(model, provider),
-                    messages=continuation_messages,
-                    provider=provider,
-                    stream=False,
-                    **{k: v for k, v in kwargs.items() if k != 'stream'}
+                logger.info("Requesting continuation from provider %s", provider_name)
+                continuation, provider = await _get_with_fallback(
+                    model, continuation_messages, providers, stream=False, **continuation_kwargs
                 )
-                
+                provider_name = get_provider_name(provider)
                 # Append continuation to full response and yield
-                logger.info(f"Received continuation of length {len(continuation)} characters")
-                full_response += "\n" + continuation
+                logger.info("Received continuation of length %d characters", len(continuation))
+                parts.append(continuation)
                 yield "\n" + continuation
-                attempts += 1
-            except Exception as e:
-                logger.error(f"Error during streaming continuation attempt with provider {provider.__name__ if hasattr(provider, '__name__') else type(provider).__name__}: {e}")
-                
-                # Try with a different provider
-                try:
-                    # Get model object to find alternative providers
-                    model_obj = None
-                    for model_name, model_obj in g4f.models.ModelUtils.convert.items():
-                        if model_name.lower() == model.lower():
-                            break
-                    
-                    alternative_provider_found = False
-                    # Check if we have a model object and if it has a best provider
-                    if model_obj and model_obj.best_provider:
-                        # If the best provider is a list of providers (IterListProvider)
-                        if isinstance(model_obj.best_provider, IterListProvider):
-                            # Get a list of providers from the retry provider
-                            for alt_provider in model_obj.best_provider.providers:
-                                # Skip the provider that just failed
-                                if alt_provider == provider:
-                                    continue
-                                
-                                logger.info(f"Trying alternative provider {alt_provider.__name__ if hasattr(alt_provider, '__name__') else type(alt_provider).__name__} for streaming continuation")
-                                try:
-                                    continuation = await g4f.ChatCompletion.create_async(
-                                        model=get_provider_specific_model_name(model, alt_provider),
-                                        messages=continuation_messages,
-                                        provider=alt_provider,
-                                        stream=False,
-                                        **{k: v for k, v in kwargs.items() if k != 'stream'}
-                                    )
-                                    # Append continuation to full response
-                                    logger.info(f"Received continuation from alternative provider of length {len(continuation)} characters")
-                                    full_response += "\n" + continuation
-                                    yield "\n" + continuation
-                                    # Update provider for future continuation attempts
-                                    provider = alt_provider
-                                    alternative_provider_found = True
-                                    break
-                                except Exception as alt_e:
-                                    logger.error(f"Alternative streaming provider also failed: {alt_e}")
-                                    continue
-                        # If the best provider is a single provider
-                        elif model_obj.best_provider != provider:
-                            # Try the best provider if it's not the one that failed
-                            logger.info(f"Trying alternative provider {model_obj.best_provider.__name__ if hasattr(model_obj.best_provider, '__name__') else type(model_obj.best_provider).__name__} for streaming continuation")
-                            try:
-                                continuation = await g4f.ChatCompletion.create_async(
-                                    model=get_provider_specific_model_name(model, model_obj.best_provider),
-                                    messages=continuation_messages,
-                                    provider=model_obj.best_provider,
-                                    stream=False,
-                                    **{k: v for k, v in kwargs.items() if k != 'stream'}
-                                )
-                                # Append continuation to full response and yield
-                                logger.info(f"Received continuation from best provider of length {len(continuation)} characters")
-                                full_response += "\n" + continuation
-                                yield "\n" + continuation
-                                # Update provider for future continuation attempts
-                                provider = model_obj.best_provider
-                                alternative_provider_found = True
-                            except Exception as alt_e:
-                                logger.error(f"Alternative streaming provider also failed: {alt_e}")
-                    
-                    # If no alternative provider was found or all failed, count this as a failed attempt
-                    if not alternative_provider_found:
-                        logger.warning("No alternative provider was found or all failed")
-                        attempts += 1
-                        
-                except Exception:
-                    # If all alternatives fail, count this as a failed attempt
-                    logger.warning("Exception while trying to find alternative providers")
-                    attempts += 1
+            except Exception:
+                # If all providers fail, count this as a failed attempt
+                logger.warning("No alternative provider was found or all failed")
+            attempts += 1
         
         # Final check if we couldn't get a complete response after maximum attempts
         if not is_complete:
-            logger.warning(f"Could not get a complete streaming response after {max_attempts} attempts. Returning best effort.")
+            logger.warning("Could not get a complete streaming response after %d attempts. Returning best effort.", max_attempts)
     
     except Exception as e:
         # If streaming fails, log error and yield nothing more
-        logger.error(f"Error during streaming: {e}")
+        logger.error("Error during streaming: %s", e)
         # We don't raise here as we've already yielded some content 
\ No newline at end of file
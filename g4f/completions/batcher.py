@@ -0,0 +1,173 @@
+"""
+Request batching for concurrent auto-continue calls.
+
+Requests submitted within a short window are collected into a batch and
+dispatched together with bounded concurrency. Identical requests that are
+in flight at the same time are coalesced, so only one provider call is made
+and every caller receives its result.
+
+AsyncBatcher hands a whole batch to a single function instead, for work
+that can be merged into one call, like completeness checks.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from typing import Optional, Callable, Awaitable, Coroutine, Any, Dict, List, Set, Tuple
+
+from ..providers.asyncio import get_loop_resources
+
+logger = logging.getLogger(__name__)
+
+class _LoopState:
+    """Queue and worker task of a batcher in one event loop, stored on the loop."""
+
+    def __init__(self):
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.worker: Optional[asyncio.Task] = None
+        self.semaphore: Optional[asyncio.Semaphore] = None
+        self.pending: Dict[str, asyncio.Future] = {}
+        # The loop only keeps weak references to its tasks
+        self.tasks: Set[asyncio.Task] = set()
+
+    def create_task(self, coro: Coroutine) -> asyncio.Task:
+        task = asyncio.get_running_loop().create_task(coro)
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        return task
+
+class _QueueWorker(ABC):
+    """Base of the batchers, with one queue and worker task per event loop."""
+
+    def __init__(self, max_batch: int, max_wait_ms: int):
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+
+    def _create_state(self) -> _LoopState:
+        return _LoopState()
+
+    def _get_state(self) -> _LoopState:
+        """Return the state of the running event loop, starting its worker if needed."""
+        resources = get_loop_resources()
+        state = resources.get(self)
+        if state is None:
+            state = resources[self] = self._create_state()
+        if state.worker is None or state.worker.done():
+            state.worker = state.create_task(self._run(state))
+        return state
+
+    async def _collect(self, state: _LoopState) -> list:
+        loop = asyncio.get_running_loop()
+        batch = [await state.queue.get()]
+        deadline = loop.time() + self.max_wait
+        while len(batch) < self.max_batch:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(state.queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    @abstractmethod
+    async def _run(self, state: _LoopState) -> None:
+        """Take batches from the queue of state and process them."""
+
+class RequestBatcher(_QueueWorker):
+    """
+    Collect requests into batches and dispatch them from a single worker task.
+
+    Args:
+        max_batch: Maximum number of requests taken from the queue per batch
+        max_wait_ms: Time to wait for more requests after the first one arrives
+        max_concurrency: Maximum number of requests running at the same time in each event loop
+    """
+
+    def __init__(self, max_batch: int = 16, max_wait_ms: int = 50, max_concurrency: int = 8):
+        super().__init__(max_batch, max_wait_ms)
+        self.max_concurrency = max_concurrency
+
+    def _create_state(self) -> _LoopState:
+        state = super()._create_state()
+        state.semaphore = asyncio.Semaphore(self.max_concurrency)
+        return state
+
+    async def submit(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Queue a request and wait for its result.
+
+        Args:
+            key: Identifies the request, requests with the same key are coalesced
+            factory: Creates the coroutine that performs the request
+        """
+        state = self._get_state()
+        future = state.pending.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            state.pending[key] = future
+            state.queue.put_nowait((key, factory, future))
+        else:
+            logger.info("Coalescing request with an identical request in flight")
+        return await asyncio.shield(future)
+
+    async def _dispatch(self, state: _LoopState, key: str, factory: Callable, future: asyncio.Future) -> None:
+        try:
+            async with state.semaphore:
+                result = await factory()
+            if not future.done():
+                future.set_result(result)
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        finally:
+            state.pending.pop(key, None)
+
+    async def _run(self, state: _LoopState) -> None:
+        while True:
+            batch = await self._collect(state)
+            logger.info("Dispatching batch of %d request(s)", len(batch))
+            for key, factory, future in batch:
+                state.create_task(self._dispatch(state, key, factory, future))
+
+class AsyncBatcher(_QueueWorker):
+    """
+    Collect items into batches and process each batch with one call of fn.
+
+    Args:
+        fn: Receives a list of items and returns a list with one result per item
+        max_batch: Maximum number of items passed to fn at once
+        max_wait_ms: Time to wait for more items after the first one arrives
+    """
+
+    def __init__(self, fn: Callable[[List[Any]], Awaitable[List[Any]]], max_batch: int = 16, max_wait_ms: int = 30):
+        super().__init__(max_batch, max_wait_ms)
+        self.fn = fn
+
+    async def submit(self, item: Any) -> Any:
+        """Queue an item and wait for its result."""
+        state = self._get_state()
+        future = asyncio.get_running_loop().create_future()
+        state.queue.put_nowait((item, future))
+        return await future
+
+    async def _dispatch(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        try:
+            results = await self.fn([item for item, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def _run(self, state: _LoopState) -> None:
+        while True:
+            batch = await self._collect(state)
+            logger.info("Processing batch of %d item(s)", len(batch))
+            state.create_task(self._dispatch(batch))
+
+batcher = RequestBatcher()
@@ -0,0 +1,198 @@
+"""
+Response cache for auto-continued completions.
+
+Completed, non-streaming responses are stored in an in-process LRU keyed on
+the model, the provider and a hash of the messages. Optionally, a semantic
+layer matches near-duplicate prompts by comparing sentence embeddings of the
+last user message, among requests with the same earlier messages.
+
+The cache is disabled by default. Configure it with environment variables:
+
+    G4F_RESPONSE_CACHE            Set to "1" to enable the exact-match cache
+    G4F_RESPONSE_CACHE_SIZE       Maximum number of cached responses (default: 256)
+    G4F_SEMANTIC_CACHE_THRESHOLD  Cosine similarity for semantic hits, e.g. "0.92"
+                                  (requires "sentence-transformers" and "numpy")
+"""
+from __future__ import annotations
+
+import os
+import re
+import json
+import asyncio
+import threading
+import hashlib
+import logging
+from collections import OrderedDict
+from functools import wraps
+from typing import Optional, Callable, Any, Tuple
+
+from ..typing import Messages
+
+try:
+    import orjson
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, sort_keys=True, default=str).encode()
+
+try:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+    has_sentence_transformers = True
+except ImportError:
+    has_sentence_transformers = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+
+def _get_number_env(name: str, parse: Callable[[str], Any], default: Any) -> Any:
+    # A malformed value must not break "import g4f"
+    value = os.environ.get(name)
+    if not value:
+        return default
+    try:
+        return parse(value)
+    except ValueError:
+        logger.warning("Invalid value for %s: %r, using %r", name, value, default)
+        return default
+
+enabled: bool = os.environ.get("G4F_RESPONSE_CACHE", "") in ("1", "true", "True")
+max_size: int = _get_number_env("G4F_RESPONSE_CACHE_SIZE", int, 256)
+semantic_threshold: Optional[float] = _get_number_env("G4F_SEMANTIC_CACHE_THRESHOLD", float, None)
+
+# Numbers and capitalized words must match for a semantic hit,
+# so "Explain Python 3.12" does not answer "Explain Python 3.8".
+_ENTITY_RE = re.compile(r"\b(?:\d+(?:\.\d+)*|[A-Z][\w-]*)\b")
+
+def _get_provider_name(provider: Any) -> str:
+    if provider is None:
+        return ""
+    return getattr(provider, "__name__", None) or type(provider).__name__
+
+def _split_last_user_message(messages: Messages) -> Tuple[Messages, Optional[str]]:
+    """Return the other messages and the text of the last user message."""
+    for index in range(len(messages) - 1, -1, -1):
+        message = messages[index]
+        if message.get("role") == "user":
+            content = message.get("content")
+            return [*messages[:index], *messages[index + 1:]], content if isinstance(content, str) else None
+    return messages, None
+
+def get_cache_key(model: str, provider: Any, messages: Messages, **kwargs) -> str:
+    """Build the exact-match key from the model, provider, messages and request options."""
+    data = _dumps([model, _get_provider_name(provider), messages, kwargs])
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+class SemanticIndex:
+    """Embeddings of cached prompts, searched by cosine similarity."""
+
+    def __init__(self, threshold: float, model_name: str = DEFAULT_EMBEDDING_MODEL):
+        self.threshold = threshold
+        self.model_name = model_name
+        self._encoder = None
+        self._encoder_lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[str, frozenset, Any]]" = OrderedDict()
+
+    def encode(self, text: str):
+        """Embed a prompt. Loading the model and encoding are slow, call this in an executor."""
+        with self._encoder_lock:
+            if self._encoder is None:
+                self._encoder = SentenceTransformer(self.model_name)
+        return self._encoder.encode(text, normalize_embeddings=True)
+
+    def add(self, key: str, scope: str, prompt: str, embedding: Any) -> None:
+        self._entries[key] = (scope, frozenset(_ENTITY_RE.findall(prompt)), embedding)
+
+    def remove(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def search(self, scope: str, prompt: str, embedding: Any) -> Optional[str]:
+        if not self._entries:
+            return None
+        entities = frozenset(_ENTITY_RE.findall(prompt))
+        candidates = [
+            (key, embedding) for key, (entry_scope, entry_entities, embedding) in self._entries.items()
+            if entry_scope == scope and entry_entities == entities
+        ]
+        if not candidates:
+            return None
+        scores = np.stack([candidate for _, candidate in candidates]) @ embedding
+        best = int(np.argmax(scores))
+        if scores[best] >= self.threshold:
+            return candidates[best][0]
+        return None
+
+class ResponseCache:
+    """LRU cache of completed responses with an optional semantic index."""
+
+    def __init__(self, max_size: int = 256, semantic_threshold: Optional[float] = None):
+        self.max_size = max_size
+        self._data: "OrderedDict[str, str]" = OrderedDict()
+        self.semantic: Optional[SemanticIndex] = None
+        if semantic_threshold is not None:
+            if has_sentence_transformers:
+                self.semantic = SemanticIndex(semantic_threshold)
+            else:
+                logger.warning('Semantic cache requires "sentence-transformers" | pip install -U sentence-transformers')
+
+    def get(self, key: str, scope: str = "", prompt: Optional[str] = None, embedding: Any = None) -> Optional[str]:
+        if key in self._data:
+            self._data.move_to_end(key)
+            return self._data[key]
+        if self.semantic is not None and prompt and embedding is not None:
+            similar_key = self.semantic.search(scope, prompt, embedding)
+            if similar_key is not None:
+                self._data.move_to_end(similar_key)
+                return self._data[similar_key]
+        return None
+
+    def set(self, key: str, value: str, scope: str = "", prompt: Optional[str] = None, embedding: Any = None) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if self.semantic is not None and prompt and embedding is not None:
+            self.semantic.add(key, scope, prompt, embedding)
+        while len(self._data) > self.max_size:
+            old_key, _ = self._data.popitem(last=False)
+            if self.semantic is not None:
+                self.semantic.remove(old_key)
+
+    def clear(self) -> None:
+        self._data.clear()
+        if self.semantic is not None:
+            self.semantic.clear()
+
+response_cache = ResponseCache(max_size, semantic_threshold)
+
+def cached_response(func: Callable) -> Callable:
+    """
+    Cache the result of an async completion function.
+
+    Streaming requests and requests with media are passed through unchanged.
+    """
+    @wraps(func)
+    async def wrapper(model: str, messages: Messages, provider: Any = None, **kwargs):
+        if not enabled or kwargs.get("stream") or kwargs.get("media"):
+            return await func(model, messages, provider, **kwargs)
+        key = get_cache_key(model, provider, messages, **kwargs)
+        cached = response_cache.get(key)
+        scope = prompt = embedding = None
+        if cached is None and response_cache.semantic is not None:
+            # Only requests with the same earlier messages and options can share an answer
+            history, prompt = _split_last_user_message(messages)
+            if prompt:
+                scope = get_cache_key(model, provider, history, **kwargs)
+                embedding = await asyncio.get_running_loop().run_in_executor(None, response_cache.semantic.encode, prompt)
+                cached = response_cache.get(key, scope, prompt, embedding)
+        if cached is not None:
+            logger.info("Returning cached response for model %s", model)
+            return cached
+        result = await func(model, messages, provider, **kwargs)
+        if isinstance(result, str) and result:
+            response_cache.set(key, result, scope, prompt, embedding)
+        return result
+    return wrapper
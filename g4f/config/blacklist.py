@@ -6,23 +6,99 @@ that will be excluded from provider selection.
 """
 from __future__ import annotations
 
-from typing import List, Set, Optional
+from typing import List, FrozenSet, Optional, Tuple
 import os
+import sys
 import json
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 
+if os.name == "nt":
+    import msvcrt
+    def _lock_file(f) -> None:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+    def _unlock_file(f) -> None:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+else:
+    import fcntl
+    def _lock_file(f) -> None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+    def _unlock_file(f) -> None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+try:
+    import orjson
+    _loads = orjson.loads
+    def _dumps(providers: List[str]) -> bytes:
+        return orjson.dumps(providers, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+    def _dumps(providers: List[str]) -> bytes:
+        return json.dumps(providers, indent=2).encode()
+
 # Default blacklist file location
 _config_dir = os.path.dirname(os.path.abspath(__file__))
 _default_blacklist_file = os.path.join(_config_dir, "provider_blacklist.json")
 
-# In-memory cache of blacklisted providers
-_blacklisted_providers: Set[str] = set()
+# In-memory cache of blacklisted providers, replaced as a whole so readers need no lock
+_blacklisted_providers: FrozenSet[str] = frozenset()
+
+# Set once a blacklist was loaded or saved, an empty blacklist is a valid state
+_loaded: bool = False
+_load_lock = threading.Lock()
+
+# Path, modification time and size of the last file read, and its contents.
+# load_blacklist only parses the file again when the stat result differs.
+_file_key: Optional[Tuple] = None
+_file_providers: List[str] = []
+
+def _get_file_key(path: str) -> Tuple:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return (path, None, None)
+    return (path, stat.st_mtime_ns, stat.st_size)
+
+def _set_blacklisted_providers(providers: List[str]) -> None:
+    """Replace the in-memory blacklist."""
+    global _blacklisted_providers, _loaded
+    _loaded = True
+    # Interned like the provider class names they are compared with, so lookups match by identity
+    _blacklisted_providers = frozenset(sys.intern(name) if isinstance(name, str) else name for name in providers)
+
+def _ensure_loaded() -> None:
+    """Load the default blacklist on first use, once across threads."""
+    if not _loaded:
+        with _load_lock:
+            if not _loaded:
+                load_blacklist()
 
 def _ensure_blacklist_file_exists():
     """Ensure the blacklist file exists, creating it if necessary."""
-    if not os.path.exists(_default_blacklist_file):
-        with open(_default_blacklist_file, 'w') as f:
-            json.dump([], f)
+    # Exclusive create, so concurrent processes can't truncate each other's file
+    try:
+        with open(_default_blacklist_file, 'x') as f:
+            f.write('[]')
+    except FileExistsError:
+        pass
+
+@contextmanager
+def _file_lock(path: str):
+    """
+    Hold an exclusive lock for the blacklist file at path, across processes.
+
+    The lock is taken on a separate ".lock" file, because saving replaces the blacklist file.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(f"{path}.lock", 'a+b') as f:
+        _lock_file(f)
+        try:
+            yield
+        finally:
+            _unlock_file(f)
 
 def load_blacklist(file_path: Optional[str] = None) -> List[str]:
     """
@@ -34,20 +110,27 @@ def load_blacklist(file_path: Optional[str] = None) -> List[str]:
     Returns:
         List of blacklisted provider names
     """
-    global _blacklisted_providers
-    
+    global _file_key, _file_providers
     path = file_path or _default_blacklist_file
-    _ensure_blacklist_file_exists()
+    # A custom file is the caller's to create, a missing one loads as empty
+    if file_path is None:
+        _ensure_blacklist_file_exists()
     
+    # Unchanged since the last read, missing files are cached as well
+    file_key = _get_file_key(path)
+    if file_key == _file_key:
+        return list(_file_providers)
+
     try:
-        with open(path, 'r') as f:
-            blacklist = json.load(f)
-            _blacklisted_providers = set(blacklist)
-            return blacklist
+        with open(path, 'rb') as f:
+            blacklist = _loads(f.read())
     except (json.JSONDecodeError, FileNotFoundError):
         # If file is empty or invalid, return empty list
-        _blacklisted_providers = set()
-        return []
+        blacklist = []
+    _file_key = file_key
+    _file_providers = blacklist
+    _set_blacklisted_providers(blacklist)
+    return list(blacklist)
 
 def save_blacklist(providers: List[str], file_path: Optional[str] = None) -> None:
     """
@@ -57,17 +140,35 @@ def save_blacklist(providers: List[str], file_path: Optional[str] = None) -> Non
         providers: List of provider names to blacklist
         file_path: Optional path to the blacklist file. If not provided, uses the default path.
     """
-    global _blacklisted_providers
-    
     path = file_path or _default_blacklist_file
+    with _file_lock(path):
+        _write_blacklist(providers, path)
+
+def _write_blacklist(providers: List[str], path: str) -> None:
+    """Write the blacklist file, the caller holds the file lock."""
+    global _file_key, _file_providers
     
     # Create directory if it doesn't exist
     os.makedirs(os.path.dirname(path), exist_ok=True)
     
-    with open(path, 'w') as f:
-        json.dump(providers, f, indent=2)
+    # Write a temporary file and swap it in, so readers never see a partial file
+    data = _dumps(providers)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
     
-    _blacklisted_providers = set(providers)
+    # The written file is known, a write within the same mtime tick must not look unchanged
+    _file_key = _get_file_key(path)
+    _file_providers = list(providers)
+    _set_blacklisted_providers(providers)
 
 def add_to_blacklist(provider_name: str, file_path: Optional[str] = None) -> List[str]:
     """
@@ -80,12 +181,16 @@ def add_to_blacklist(provider_name: str, file_path: Optional[str] = None) -> Lis
     Returns:
         Updated list of blacklisted provider names
     """
-    providers = load_blacklist(file_path)
-    
-    # Add provider if not already in the list
-    if provider_name not in providers:
-        providers.append(provider_name)
-        save_blacklist(providers, file_path)
+    path = file_path or _default_blacklist_file
+    # Read and write under one lock, so concurrent changes from other processes aren't lost
+    with _file_lock(path):
+        # Only stats the file if it is unchanged since the last load or save
+        providers = load_blacklist(file_path)
+        
+        # Add provider if not already in the list
+        if provider_name not in _blacklisted_providers:
+            providers.append(provider_name)
+            _write_blacklist(providers, path)
     
     return providers
 
@@ -100,15 +205,63 @@ def remove_from_blacklist(provider_name: str, file_path: Optional[str] = None) -
     Returns:
         Updated list of blacklisted provider names
     """
-    providers = load_blacklist(file_path)
+    path = file_path or _default_blacklist_file
+    with _file_lock(path):
+        # Only stats the file if it is unchanged since the last load or save
+        providers = load_blacklist(file_path)
+        
+        # Remove provider if in the list
+        if provider_name in _blacklisted_providers:
+            providers.remove(provider_name)
+            _write_blacklist(providers, path)
     
-    # Remove provider if in the list
-    if provider_name in providers:
-        providers.remove(provider_name)
-        save_blacklist(providers, file_path)
+    return providers
+
+def add_many_to_blacklist(provider_names: List[str], file_path: Optional[str] = None) -> List[str]:
+    """
+    Add several providers to the blacklist with a single file write.
+    
+    Args:
+        provider_names: Names of the providers to blacklist
+        file_path: Optional path to the blacklist file. If not provided, uses the default path.
+        
+    Returns:
+        Updated list of blacklisted provider names
+    """
+    path = file_path or _default_blacklist_file
+    with _file_lock(path):
+        providers = load_blacklist(file_path)
+        new_providers = [name for name in dict.fromkeys(provider_names) if name not in _blacklisted_providers]
+        
+        if new_providers:
+            providers.extend(new_providers)
+            _write_blacklist(providers, path)
     
     return providers
 
+def remove_many_from_blacklist(provider_names: List[str], file_path: Optional[str] = None) -> List[str]:
+    """
+    Remove several providers from the blacklist with a single file write.
+    
+    Args:
+        provider_names: Names of the providers to remove from blacklist
+        file_path: Optional path to the blacklist file. If not provided, uses the default path.
+        
+    Returns:
+        Updated list of blacklisted provider names
+    """
+    path = file_path or _default_blacklist_file
+    with _file_lock(path):
+        providers = load_blacklist(file_path)
+        removed = _blacklisted_providers.intersection(provider_names)
+        if not removed:
+            return providers
+        
+        remaining = [name for name in providers if name not in removed]
+        _write_blacklist(remaining, path)
+    
+    return remaining
+
 def get_blacklist() -> List[str]:
     """
     Get the current blacklisted providers.
@@ -116,11 +269,21 @@ def get_blacklist() -> List[str]:
     Returns:
         List of blacklisted provider names
     """
-    if not _blacklisted_providers:
-        load_blacklist()
+    _ensure_loaded()
     
     return list(_blacklisted_providers)
 
+def get_blacklist_set() -> FrozenSet[str]:
+    """
+    Get the current blacklisted providers without copying them.
+    
+    Returns:
+        Frozen set of blacklisted provider names
+    """
+    _ensure_loaded()
+    
+    return _blacklisted_providers
+
 def is_blacklisted(provider_name: str) -> bool:
     """
     Check if a provider is blacklisted.
@@ -131,10 +294,11 @@ def is_blacklisted(provider_name: str) -> bool:
     Returns:
         True if the provider is blacklisted, False otherwise
     """
-    if not _blacklisted_providers:
-        load_blacklist()
+    if not _loaded:
+        _ensure_loaded()
     
-    return provider_name in _blacklisted_providers
-
-# Initialize the blacklist on module import
-load_blacklist() 
\ No newline at end of file
+    # Usually nothing is blacklisted, then the name isn't hashed or looked up
+    providers = _blacklisted_providers
+    if not providers:
+        return False
+    return provider_name in providers
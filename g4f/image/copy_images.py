@@ -15,7 +15,6 @@ from ..requests.aiohttp import get_connector, StreamResponse
 from ..image import MEDIA_TYPE_MAP, EXTENSIONS_MAP
 from ..tools.files import secure_filename
 from ..providers.response import ImageResponse, AudioResponse, VideoResponse
-from ..Provider.template import BackendApi
 from . import is_accepted_format, extract_data_uri
 from .. import debug
 
@@ -120,6 +119,8 @@ async def copy_media(
                     with open(target_path, "wb") as f:
                         f.write(extract_data_uri(image))
                 else:
+                    # Imported here, g4f.Provider imports this module
+                    from ..Provider.template import BackendApi
                     # Apply BackendApi settings if needed
                     if BackendApi.working and image.startswith(BackendApi.url):
                         request_headers = BackendApi.headers if headers is None else headers
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
+import inspect
+import threading
+import weakref
 from asyncio import AbstractEventLoop, runners
-from typing import Optional, Callable, AsyncIterator, Iterator
+from typing import Optional, Callable, AsyncIterator, Iterator, Coroutine, Any
 
 from ..errors import NestAsyncioError
 
@@ -33,6 +37,84 @@ def get_running_loop(check_nested: bool) -> Optional[AbstractEventLoop]:
     except RuntimeError:
         pass
 
+# Loops that have resources, to close these at interpreter exit
+_resource_loops: "weakref.WeakSet[AbstractEventLoop]" = weakref.WeakSet()
+
+def get_loop_resources() -> dict:
+    """
+    Return the resources owned by the running event loop, like its shared connector.
+
+    They are stored on the loop, so they are freed together with it.
+    Resources with a close method are closed by close_event_loop.
+    """
+    loop = asyncio.get_running_loop()
+    resources = loop.__dict__.get("_g4f_resources")
+    if resources is None:
+        resources = loop.__dict__["_g4f_resources"] = {}
+        _resource_loops.add(loop)
+    return resources
+
+async def _close_resources(resources: dict) -> None:
+    for resource in resources.values():
+        close = getattr(resource, "close", None)
+        if close is not None:
+            result = close()
+            if inspect.isawaitable(result):
+                await result
+
+def close_event_loop(loop: AbstractEventLoop) -> None:
+    """Cancel the remaining tasks, close the loop's resources, shut down async generators and the default executor, then close the loop."""
+    if loop.is_closed() or loop.is_running():
+        return
+    try:
+        runners._cancel_all_tasks(loop)
+        loop.run_until_complete(_close_resources(loop.__dict__.pop("_g4f_resources", {})))
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        if hasattr(loop, "shutdown_default_executor"):
+            loop.run_until_complete(loop.shutdown_default_executor())
+    finally:
+        loop.close()
+
+@atexit.register
+def _close_loop_resources() -> None:
+    # Loops that are not closed by g4f, like the ones of asyncio.run, keep running until exit
+    for loop in list(_resource_loops):
+        if not loop.is_closed() and not loop.is_running():
+            loop.run_until_complete(_close_resources(loop.__dict__.pop("_g4f_resources", {})))
+
+class _ThreadEventLoop:
+    """Holds the event loop of a thread, the loop is closed when the thread exits."""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        # Thread-local data is released when its thread exits, or at interpreter exit
+        weakref.finalize(self, close_event_loop, self.loop)
+
+_thread_local = threading.local()
+
+def get_thread_event_loop() -> AbstractEventLoop:
+    """Return an event loop owned by the current thread, creating it on first use."""
+    holder = getattr(_thread_local, "holder", None)
+    if holder is None or holder.loop.is_closed():
+        holder = _ThreadEventLoop()
+        _thread_local.holder = holder
+    return holder.loop
+
+def run_until_complete(coro: Coroutine) -> Any:
+    """
+    Run a coroutine from synchronous code.
+
+    Unlike asyncio.run, the event loop is kept open and reused by later calls
+    from the same thread, so connectors and sessions bound to it survive.
+    It is closed when the thread exits.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return get_thread_event_loop().run_until_complete(coro)
+    # Nested call inside a running loop, needs nest_asyncio like before
+    return asyncio.run(coro)
+
 # Fix for RuntimeError: async generator ignored GeneratorExit
 async def await_callback(callback: Callable):
     return await callback()
@@ -59,13 +141,9 @@ def to_sync_generator(generator: AsyncIterator, stream: bool = True) -> Iterator
     finally:
         if new_loop:
             try:
-                runners._cancel_all_tasks(loop)
-                loop.run_until_complete(loop.shutdown_asyncgens())
-                if hasattr(loop, "shutdown_default_executor"):
-                    loop.run_until_complete(loop.shutdown_default_executor())
+                close_event_loop(loop)
             finally:
                 asyncio.set_event_loop(None)
-                loop.close()
 
 # Helper function to convert a synchronous iterator to an async iterator
 async def to_async_iterator(iterator) -> AsyncIterator:
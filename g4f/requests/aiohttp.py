@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import json
-from aiohttp import ClientSession, ClientResponse, ClientTimeout, BaseConnector, FormData
+from aiohttp import ClientSession, ClientResponse, ClientTimeout, BaseConnector, TCPConnector, FormData
 from typing import AsyncIterator, Any, Optional
 
 from .defaults import DEFAULT_HEADERS
 from ..errors import MissingRequirementsError
+from ..providers.asyncio import get_loop_resources
 
 class StreamResponse(ClientResponse):
     async def iter_lines(self) -> AsyncIterator[bytes]:
@@ -72,4 +73,20 @@ def get_connector(connector: BaseConnector = None, proxy: str = None, rdns: bool
             connector = ProxyConnector.from_url(proxy, rdns=rdns)
         except ImportError:
             raise MissingRequirementsError('Install "aiohttp_socks" package for proxy support')
-    return connector
\ No newline at end of file
+    return connector
+
+def get_shared_connector(limit: int = 100, limit_per_host: int = 20, keepalive_timeout: int = 60) -> TCPConnector:
+    """
+    Return the connection pool of the running event loop, creating it on first use.
+
+    Providers open a new ClientSession per request and close it afterwards.
+    Passing this connector lets consecutive requests reuse pooled keep-alive
+    connections. Sessions using it must be created with connector_owner=False.
+    The connector belongs to the loop and is closed together with it.
+    """
+    resources = get_loop_resources()
+    connector = resources.get("shared_connector")
+    if connector is None or connector.closed:
+        connector = TCPConnector(limit=limit, limit_per_host=limit_per_host, keepalive_timeout=keepalive_timeout)
+        resources["shared_connector"] = connector
+    return connector
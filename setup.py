@@ -44,6 +44,8 @@ EXTRA_REQUIRE = {
         "odfpy",
         "ebooklib",
         "openpyxl",
+        "orjson",                  # cache keys
+        "regex",                   # auto_continue
     ],
     'slim': [
         "curl_cffi>=0.6.2",